@@ -5,6 +5,7 @@ from .addon import ThirdPartyDistAddon
 from .utils import (
     is_ffmpeg_download_needed,
     is_oiio_download_needed,
+    invalidate_download_needed_cache,
     download_ffmpeg,
     download_oiio,
     get_ffmpeg_arguments,
@@ -19,6 +20,7 @@ __all__ = (
 
     "is_ffmpeg_download_needed",
     "is_oiio_download_needed",
+    "invalidate_download_needed_cache",
     "download_ffmpeg",
     "download_oiio",
     "get_ffmpeg_arguments",
@@ -5,6 +5,7 @@ from .version import __version__
 from .utils import (
     is_ffmpeg_download_needed,
     is_oiio_download_needed,
+    invalidate_download_needed_cache,
 )
 
 
@@ -50,3 +51,4 @@ class ThirdPartyDistAddon(AYONAddon, ITrayAddon):
     def _on_download_finish(self):
         self._download_window.close()
         self._download_window = None
+        invalidate_download_needed_cache()
@@ -1,6 +1,8 @@
+import time
 import uuid
 import threading
-from functools import partial
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Callable
 
 from qtpy import QtWidgets, QtCore
@@ -14,62 +16,181 @@ from .utils import (
     download_oiio,
 )
 
+# Minimum interval in seconds between transferred size change notifications
+PROGRESS_INTERVAL = 0.25
+# Maximum number of tools downloaded at the same time
+MAX_DOWNLOAD_WORKERS = 4
+
+
+class NotifyingTransferProgress(TransferProgress):
+    """Transfer progress which calls a callback on change.
+
+    Changes of transferred size are reported at most once per
+    'PROGRESS_INTERVAL' seconds, state changes are reported immediately.
+    """
+    def __init__(self):
+        super().__init__()
+        self._callback = None
+        self._last_notification = 0.0
+
+    def set_callback(self, callback: Optional[Callable[[], None]]):
+        self._callback = callback
+
+    def _notify(self, throttle: bool = False):
+        if self._callback is None:
+            return
+        now = time.monotonic()
+        if throttle and now - self._last_notification < PROGRESS_INTERVAL:
+            return
+        self._last_notification = now
+        self._callback()
+
+    def set_started(self):
+        super().set_started()
+        self._notify()
+
+    def set_transfer_done(self):
+        super().set_transfer_done()
+        self._notify()
+
+    def set_failed(self, reason: str):
+        super().set_failed(reason)
+        self._notify()
+
+    def set_transferred_size(self, transferred: int):
+        super().set_transferred_size(transferred)
+        self._notify(throttle=True)
+
+    def add_transferred_chunk(self, chunk_size: int):
+        super().add_transferred_chunk(chunk_size)
+        self._notify(throttle=True)
+
+
+class DownloadItemSignals(QtCore.QObject):
+    """Signals of download item emitted from download thread."""
+    progress_changed = QtCore.Signal()
+    download_finished = QtCore.Signal()
+
 
 class DownloadItem:
-    def __init__(self, title: str, func: Callable):
+    __slots__ = (
+        "_id",
+        "_func",
+        "_finished_callback",
+        "_signals",
+        "_future",
+        "_failed",
+        "_fail_reason",
+        "_finished",
+        "title",
+        "progress",
+    )
+
+    def __init__(
+        self,
+        title: str,
+        func: Callable,
+        finished_callback: Optional[Callable[["DownloadItem"], None]] = None,
+    ):
         self._id = uuid.uuid4().hex
-        progress = TransferProgress()
-        self._func = partial(func, progress)
+        progress = NotifyingTransferProgress()
+        signals = DownloadItemSignals()
+        progress.set_callback(signals.progress_changed.emit)
         self.title = title
         self.progress = progress
-        self._thread = None
+        self._func = func
+        self._finished_callback = finished_callback
+        self._signals = signals
+        self._future = None
+        self._failed = False
+        self._fail_reason = None
+        self._finished = False
 
     @property
     def id(self) -> str:
         return self._id
 
+    @property
+    def signals(self) -> DownloadItemSignals:
+        return self._signals
+
+    @property
+    def future(self) -> Optional[Future]:
+        return self._future
+
     @property
     def finished(self) -> bool:
-        if self._thread is None:
+        # Future is marked as done only after finished signal is emitted
+        if self._future is None:
             return True
-        return not self._thread.is_alive()
+        return self._finished
 
-    def download(self):
-        if self._thread is None:
-            self._thread = threading.Thread(target=self._func)
-            self._thread.start()
+    @property
+    def failed(self) -> bool:
+        return self._failed
+
+    @property
+    def fail_reason(self) -> Optional[str]:
+        return self._fail_reason
+
+    def _download(self):
+        try:
+            self._func(self.progress)
+        except Exception as exc:
+            self._failed = True
+            self._fail_reason = str(exc) or exc.__class__.__name__
+            traceback.print_exc()
+        finally:
+            self._finished = True
+            if self._finished_callback is not None:
+                self._finished_callback(self)
+            self._signals.download_finished.emit()
+
+    def download(self, executor: ThreadPoolExecutor) -> Future:
+        if self._future is None:
+            self._future = executor.submit(self._download)
+        return self._future
 
     def finish(self):
-        if self._thread is None:
-            return
-        self._thread.join()
-        self._thread = None
+        if self._future is not None:
+            self._future.result()
 
 
 class DownloadController:
     def __init__(self, ffmpeg: bool, oiio: bool):
         items = []
         if ffmpeg:
-            items.append(DownloadItem("FFmpeg", download_ffmpeg))
+            items.append(DownloadItem(
+                "FFmpeg", download_ffmpeg, self._on_item_finished
+            ))
 
         if oiio:
-            items.append(DownloadItem("OpenImageIO", download_oiio))
-        self._items = items
+            items.append(DownloadItem(
+                "OpenImageIO", download_oiio, self._on_item_finished
+            ))
+        self._items = tuple(items)
         self._items_by_id = {
             item.id: item
             for item in items
         }
+        self._id_item_pairs = tuple(self._items_by_id.items())
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(min(len(items), MAX_DOWNLOAD_WORKERS), 1),
+            thread_name_prefix="ayon-3pdl",
+        )
         self._download_started = False
         self._download_finished = False
+        # Counters are changed from download threads
+        self._counters_lock = threading.Lock()
+        self._pending = 0
+        self._failed_count = 0
 
     def items(self):
-        for item_id, item in self._items_by_id.items():
-            yield item_id, item
+        return iter(self._id_item_pairs)
 
     @property
     def download_items(self):
-        for item in self._items:
-            yield item
+        return iter(self._items)
 
     @property
     def download_started(self) -> bool:
@@ -81,26 +202,35 @@ class DownloadController:
 
     @property
     def is_downloading(self) -> bool:
-        if not self._download_started or self._download_finished:
-            return False
+        return (
+            self._download_started
+            and not self._download_finished
+            and self._pending > 0
+        )
 
-        for item in self.download_items:
-            if not item.finished:
-                return True
-        return False
+    @property
+    def download_failed(self) -> bool:
+        return self._failed_count > 0
+
+    def _on_item_finished(self, item: DownloadItem):
+        with self._counters_lock:
+            self._pending -= 1
+            if item.failed:
+                self._failed_count += 1
 
     def start_download(self):
         if self._download_started:
             return
         self._download_started = True
+        self._pending = len(self._items)
         for item in self.download_items:
-            item.download()
+            item.download(self._executor)
 
     def finish_download(self):
         if self._download_finished:
             return
-        for item in self.download_items:
-            item.finish()
+        # Called when all items finished, errors are stored on items
+        self._executor.shutdown(wait=False)
         self._download_finished = True
 
 
@@ -118,10 +248,25 @@ class DownloadItemWidget(QtWidgets.QWidget):
         self._title_label = title_label
         self._progress_label = progress_label
         self._download_item = download_item
+        self._last_text = progress_label.text()
+        self._last_percent = None
+
+    def _set_progress_text(self, text: str):
+        # Avoid relayout and repaint of label if text did not change
+        if text != self._last_text:
+            self._last_text = text
+            self._progress_label.setText(text)
 
     def update_progress(self):
+        if self._download_item.failed:
+            self._set_progress_text("Failed")
+            self._progress_label.setToolTip(
+                self._download_item.fail_reason or ""
+            )
+            return
+
         if self._download_item.finished:
-            self._progress_label.setText("Finished")
+            self._set_progress_text("Finished")
             return
 
         progress = self._download_item.progress
@@ -137,12 +282,16 @@ class DownloadItemWidget(QtWidgets.QWidget):
         if progress_is_running:
             transfer_progress = progress.transfer_progress
             if transfer_progress is None:
-                transfer_progress = "Downloading..."
-            else:
-                transfer_progress = "{:.2f}%".format(transfer_progress)
-            self._progress_label.setText(transfer_progress)
+                self._set_progress_text("Downloading...")
+                return
+
+            # Percent with 2 decimals as integer
+            percent = int(transfer_progress * 100)
+            if percent != self._last_percent:
+                self._last_percent = percent
+                self._set_progress_text("{:.2f}%".format(percent / 100))
             return
-        self._progress_label.setText("Extracting...")
+        self._set_progress_text("Extracting...")
 
 
 class DownloadWindow(QtWidgets.QWidget):
@@ -167,20 +316,22 @@ class DownloadWindow(QtWidgets.QWidget):
             item_widget = DownloadItemWidget(item, content_widget)
             item_widgets.append(item_widget)
             content_layout.addWidget(item_widget, 0)
+            item.signals.progress_changed.connect(
+                item_widget.update_progress, QtCore.Qt.QueuedConnection
+            )
+            item.signals.download_finished.connect(
+                self._on_item_finished, QtCore.Qt.QueuedConnection
+            )
         content_layout.addStretch(1)
 
         main_layout = QtWidgets.QVBoxLayout(self)
         main_layout.addWidget(content_widget, 1)
 
-        timer = QtCore.QTimer()
-        timer.setInterval(10)
-        timer.timeout.connect(self._on_timer)
-
-        self._timer = timer
         self._controller = controller
         self._item_widgets = item_widgets
         self._first_show = True
         self._start_on_show = False
+        self._finished_emitted = False
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -193,27 +344,34 @@ class DownloadWindow(QtWidgets.QWidget):
         if self._start_on_show:
             self.start()
 
-    def _update_progress(self):
-        for widget in self._item_widgets:
-            widget.update_progress()
-
-    def _on_timer(self):
+    def closeEvent(self, event):
+        super().closeEvent(event)
+        # Window is kept open after failed download until user closes it
         if self._controller.download_finished:
-            self._timer.stop()
+            self._emit_finished()
+
+    def _emit_finished(self):
+        if not self._finished_emitted:
+            self._finished_emitted = True
             self.finished.emit()
-            return
 
-        if not self._controller.download_started:
-            self._controller.start_download()
-            self._update_progress()
-            return
+    def _update_progress(self):
+        for widget in self._item_widgets:
+            widget.update_progress()
 
-        if self._controller.is_downloading:
-            self._update_progress()
+    def _on_item_finished(self):
+        self._update_progress()
+        if (
+            self._controller.download_finished
+            or self._controller.is_downloading
+        ):
             return
 
         self._controller.finish_download()
         self._update_progress()
+        # Keep window open so user can see which download failed
+        if not self._controller.download_failed:
+            self._emit_finished()
 
     def start(self):
         if self._first_show:
@@ -221,7 +379,8 @@ class DownloadWindow(QtWidgets.QWidget):
             return
         if self._controller.download_started:
             return
-        self._timer.start()
+        self._controller.start_download()
+        self._update_progress()
 
 
 def show_download_window(
@@ -1,15 +1,28 @@
 import os
+import io
+import errno
 import json
+import pickle
 import platform
-import datetime
+import shutil
+import stat
+import struct
+import select
 import subprocess
-import copy
 import hashlib
+import mmap
 import zipfile
 import tarfile
+import tempfile
+import time
+import threading
+import contextlib
 import typing
-from typing import Optional, Tuple, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, lru_cache
+from typing import Optional, Tuple, List, Dict, Any, Callable, BinaryIO
 
+import requests
 import ayon_api
 from ayon_api import TransferProgress
 
@@ -18,6 +31,33 @@ try:
 except ImportError:
     from ayon_core.lib import get_ayon_appdirs as get_launcher_storage_dir
 
+if platform.system() == "Windows":
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+    msvcrt = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import libarchive
+except ImportError:
+    libarchive = None
+
+try:
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .version import __version__
 from .constants import ADDON_NAME
 
@@ -45,14 +85,99 @@ if typing.TYPE_CHECKING:
         platform: Literal["windows", "linux", "darwin"]
 
 
+class _NotSet:
+    """Sentinel of values which were not resolved yet."""
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return "NOT_SET"
+
+
+PLATFORM_NAME = platform.system().lower()
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
-DOWNLOAD_DIR = os.path.join(
-    CURRENT_DIR, "downloads", platform.system().lower()
-)
-NOT_SET = type("NOT_SET", (), {"__bool__": lambda: False})()
+DOWNLOAD_DIR = os.path.join(CURRENT_DIR, "downloads", PLATFORM_NAME)
+# Server endpoint of this addon version
+_ADDON_ENDPOINT = f"addons/{ADDON_NAME}/{__version__}"
+NOT_SET = _NotSet()
 IMPLEMENTED_ARCHIVE_FORMATS = {
     ".zip", ".tar", ".tgz", ".tar.gz", ".tar.xz", ".tar.bz2"
 }
+if zstandard is not None:
+    IMPLEMENTED_ARCHIVE_FORMATS |= {".tzst", ".tar.zst"}
+# Filter refusing unsafe members, available since Python 3.11.4
+_TAR_DATA_FILTER = getattr(tarfile, "data_filter", None)
+_TAR_FILTER_ERRORS = getattr(tarfile, "FilterError", ())
+# Seconds after which validation subprocess is killed
+VALIDATION_TIMEOUT = 10
+# Seconds to wait for file lock on Windows, lock is held during download
+FILE_LOCK_TIMEOUT = 30 * 60
+# Keyword arguments of validation subprocesses
+_POPEN_KWARGS = {
+    "stdin": subprocess.DEVNULL,
+    "stdout": subprocess.DEVNULL,
+    "stderr": subprocess.DEVNULL,
+}
+if PLATFORM_NAME == "windows":
+    _POPEN_KWARGS["creationflags"] = (
+        subprocess.CREATE_NEW_PROCESS_GROUP
+        | getattr(subprocess, "DETACHED_PROCESS", 0)
+        | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    )
+# Path to executables relative to root of downloaded tools
+if PLATFORM_NAME == "windows":
+    _FFMPEG_TOOL_SUBPATH = ("bin", "{}.exe")
+    _OIIO_TOOL_SUBPATH = ("{}.exe",)
+elif PLATFORM_NAME == "linux":
+    _FFMPEG_TOOL_SUBPATH = ("{}",)
+    _OIIO_TOOL_SUBPATH = ("bin", "{}")
+else:
+    _FFMPEG_TOOL_SUBPATH = ("{}",)
+    _OIIO_TOOL_SUBPATH = ("{}",)
+# Tar archive extensions, longer extensions are first
+TAR_EXTENSIONS = (
+    ".tar.bz2",
+    ".tar.zst",
+    ".tar.gz",
+    ".tar.xz",
+    ".tzst",
+    ".tgz",
+    ".tar",
+)
+# Archive type by extension and extensions ordered from longest
+_ARCHIVE_EXT_TYPES = {".zip": "zip"}
+_ARCHIVE_EXT_TYPES.update((ext, "tar") for ext in TAR_EXTENSIONS)
+_ARCHIVE_EXTENSIONS = tuple(
+    sorted(_ARCHIVE_EXT_TYPES, key=len, reverse=True)
+)
+# Size of chunks read from http response
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Number of concurrent connections used to download a file by ranges
+DOWNLOAD_CONNECTIONS = 4
+# Files smaller than this are not split to ranges
+RANGED_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+# Download progress is persisted after this many bytes or seconds
+DOWNLOAD_META_STORE_SIZE = 16 * 1024 * 1024
+DOWNLOAD_META_STORE_INTERVAL = 2.0
+# Files larger than this are hashed from memory mapping
+MMAP_CHECKSUM_MIN_SIZE = 16 * 1024 * 1024
+# Seconds for which addon settings stored on disk are used
+ADDON_SETTINGS_TTL = 60
+# Seconds for which server files info is cached
+SERVER_FILES_INFO_TTL = 30
+# Checksum algorithms ordered from the most preferred
+PREFERRED_CHECKSUM_ALGORITHMS = ("blake2b", "sha256", "sha1", "md5")
+# Maximum number of persisted successful tool validations
+VALIDATION_CACHE_SIZE = 256
+# Maximum number of threads extracting zip members
+ZIP_EXTRACT_WORKERS = 8
+# Sidecar file with CRC32 of extracted zip members
+EXTRACT_MANIFEST_FILENAME = ".extracted_crc32.json"
+# File with relative paths and sizes of distributed files
+DISTRIBUTION_MANIFEST_FILENAME = ".distribution_manifest.json"
+
 
 class _OIIOArgs:
     download_needed = None
@@ -79,6 +204,110 @@ class _FFmpegArgs:
 
 class _ThirdPartyCache:
     addon_settings = NOT_SET
+    addon_settings_pickle = NOT_SET
+    server_files_info = NOT_SET
+    server_files_info_time = 0.0
+    files_info_index = NOT_SET
+    validated_args = NOT_SET
+    validation_results = {}
+    file_info = {}
+    persisted_tool_args = NOT_SET
+    http_session = None
+
+
+@contextlib.contextmanager
+def _file_lock(lock_path: str):
+    """Exclusive lock across processes.
+
+    Lock is held by an exclusive OS file lock on 'lock_path' so waiting
+        process is blocked by kernel until the lock is released. The lock
+        is released by OS also when the owning process crashes.
+
+    Args:
+        lock_path (str): Path to lock file. Parent directory must exist.
+
+    """
+    with open(lock_path, "a+b") as stream:
+        fd = stream.fileno()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            # 'LK_LOCK' gives up after 10 seconds with 'EDEADLOCK'
+            start = time.monotonic()
+            while True:
+                try:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as exc:
+                    if exc.errno not in (errno.EDEADLOCK, errno.EACCES):
+                        raise
+                    if time.monotonic() - start > FILE_LOCK_TIMEOUT:
+                        raise TimeoutError(
+                            f"Failed to acquire lock '{lock_path}'"
+                            f" in {FILE_LOCK_TIMEOUT} seconds."
+                        ) from exc
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _read_json(path: str) -> Any:
+    """Read JSON file.
+
+    Uses 'orjson' when available.
+
+    Args:
+        path (str): Path to JSON file.
+
+    Returns:
+        Any: Parsed data.
+
+    Raises:
+        OSError: File can't be read.
+        ValueError: File does not contain valid JSON.
+
+    """
+    with open(path, "rb") as stream:
+        content = stream.read()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _atomic_write_json(path: str, data: Any):
+    """Write JSON file atomically.
+
+    Data are written to a temporary file in the same directory which then
+        replaces the target file. Readers never see partially written file,
+        even if the process crashes during write.
+
+    Args:
+        path (str): Path to JSON file.
+        data (Any): JSON serializable data.
+
+    """
+    if orjson is not None:
+        content = orjson.dumps(data)
+    else:
+        content = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(path)}-",
+        dir=os.path.dirname(path) or None,
+    )
+    try:
+        with os.fdopen(fd, "wb") as stream:
+            stream.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 class ZipFileLongPaths(zipfile.ZipFile):
@@ -89,31 +318,282 @@ class ZipFileLongPaths(zipfile.ZipFile):
     That limit can be exceeded by using an extended-length path that
     starts with the '\\?\' prefix.
     """
-    _is_windows = platform.system().lower() == "windows"
+    _is_windows = PLATFORM_NAME == "windows"
+    # 'os.sendfile' can write to regular files only on linux
+    _use_sendfile = PLATFORM_NAME == "linux"
+
+    @classmethod
+    def to_long_path(cls, path: str) -> str:
+        """Convert path to extended-length path on Windows.
+
+        Args:
+            path (str): Path to convert.
+
+        Returns:
+            str: Extended-length path on Windows, unchanged path otherwise.
+
+        """
+        if not cls._is_windows:
+            return path
+        path = os.path.abspath(path)
+        if path.startswith("\\\\?\\"):
+            return path
+        if path.startswith("\\\\"):
+            return "\\\\?\\UNC\\" + path[2:]
+        return "\\\\?\\" + path
 
     def _extract_member(self, member, tpath, pwd):
-        if self._is_windows:
-            tpath = os.path.abspath(tpath)
-            if tpath.startswith("\\\\"):
-                tpath = "\\\\?\\UNC\\" + tpath[2:]
-            else:
-                tpath = "\\\\?\\" + tpath
+        tpath = self.to_long_path(tpath)
+
+        if not isinstance(member, zipfile.ZipInfo):
+            member = self.getinfo(member)
+
+        if member.is_dir():
+            return super()._extract_member(member, tpath, pwd)
+        if self._can_sendfile(member):
+            return self._extract_stored_member(member, tpath)
+        return self._extract_file_member(member, tpath, pwd)
+
+    @staticmethod
+    def get_member_target_path(member: zipfile.ZipInfo, tpath: str) -> str:
+        """Path where member would be extracted.
+
+        Path sanitization matches 'zipfile.ZipFile._extract_member'.
+
+        Args:
+            member (zipfile.ZipInfo): Archive member.
+            tpath (str): Target directory.
+
+        Returns:
+            str: Path to extracted file.
+
+        """
+        arcname = member.filename.replace("/", os.path.sep)
+        if os.path.altsep:
+            arcname = arcname.replace(os.path.altsep, os.path.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        invalid_path_parts = ("", os.path.curdir, os.path.pardir)
+        arcname = os.path.sep.join(
+            part
+            for part in arcname.split(os.path.sep)
+            if part not in invalid_path_parts
+        )
+        if os.path.sep == "\\":
+            arcname = zipfile.ZipFile._sanitize_windows_name(
+                arcname, os.path.sep
+            )
+        return os.path.normpath(os.path.join(tpath, arcname))
+
+    def extract_changed(self, dst_folder: str) -> int:
+        """Extract only members which differ from already extracted files.
+
+        CRC32 of extracted members is stored to a sidecar file in
+            'dst_folder'. Member is skipped if CRC32 from the sidecar matches
+            CRC32 in the archive and the file on disk has the same size.
+
+        Args:
+            dst_folder (str): Directory where content will be extracted.
+
+        Returns:
+            int: Number of extracted members.
+
+        """
+        manifest_path = os.path.join(dst_folder, EXTRACT_MANIFEST_FILENAME)
+        manifest = {}
+        if os.path.exists(manifest_path):
+            try:
+                manifest = _read_json(manifest_path)
+            except (OSError, ValueError):
+                manifest = {}
+
+        new_manifest = {}
+        dirpaths = set()
+        changed_members = []
+        for member in self.infolist():
+            target_path = self.get_member_target_path(member, dst_folder)
+            if member.is_dir():
+                dirpaths.add(target_path)
+                continue
+            dirpaths.add(os.path.dirname(target_path))
+            new_manifest[member.filename] = member.CRC
+            if manifest.get(member.filename) == member.CRC:
+                try:
+                    if os.path.getsize(target_path) == member.file_size:
+                        continue
+                except OSError:
+                    pass
+            changed_members.append(member)
+
+        # Create directories before extraction so workers don't race on
+        #   creation of the same directory
+        for dirpath in sorted(dirpaths):
+            os.makedirs(self.to_long_path(dirpath), exist_ok=True)
+
+        max_workers = min(os.cpu_count() or 1, ZIP_EXTRACT_WORKERS)
+        if (
+            len(changed_members) < 2
+            or max_workers < 2
+            or self.filename is None
+        ):
+            for member in changed_members:
+                self.extract(member, dst_folder)
+        else:
+            self._extract_parallel(changed_members, dst_folder, max_workers)
+
+        _atomic_write_json(manifest_path, new_manifest)
+        return len(changed_members)
+
+    def _extract_parallel(
+        self,
+        members: List[zipfile.ZipInfo],
+        dst_folder: str,
+        max_workers: int,
+    ):
+        """Extract members in multiple threads.
+
+        Decompression releases GIL. Reading from shared file object of one
+            'ZipFile' is not thread safe so each thread opens own archive.
+
+        Args:
+            members (list[zipfile.ZipInfo]): Members to extract.
+            dst_folder (str): Directory where content will be extracted.
+            max_workers (int): Maximum number of threads.
+
+        """
+        thread_data = threading.local()
+        archives = []
+        archives_lock = threading.Lock()
+
+        def _extract(member):
+            archive = getattr(thread_data, "archive", None)
+            if archive is None:
+                archive = self.__class__(self.filename)
+                thread_data.archive = archive
+                with archives_lock:
+                    archives.append(archive)
+            archive.extract(member, dst_folder)
 
-        return super()._extract_member(member, tpath, pwd)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_extract, member)
+                    for member in members
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            for archive in archives:
+                archive.close()
+
+    def _can_sendfile(self, member: zipfile.ZipInfo) -> bool:
+        if (
+            not self._use_sendfile
+            or member.compress_type != zipfile.ZIP_STORED
+            or member.is_dir()
+            # Encrypted member
+            or member.flag_bits & 0x1
+        ):
+            return False
+        try:
+            self.fp.fileno()
+        except (AttributeError, OSError, ValueError):
+            return False
+        return True
+
+    def _extract_file_member(
+        self, member: zipfile.ZipInfo, tpath: str, pwd: Optional[bytes]
+    ) -> str:
+        """Extract file member using large buffer.
+
+        Default buffer of 'shutil.copyfileobj' is small, copying with
+            'DOWNLOAD_CHUNK_SIZE' buffer needs much less read and write
+            calls for large binaries.
+        """
+        targetpath = self.get_member_target_path(member, tpath)
+        upperdirs = os.path.dirname(targetpath)
+        if upperdirs:
+            os.makedirs(upperdirs, exist_ok=True)
+
+        with self.open(member, pwd=pwd) as source, \
+                open(targetpath, "wb") as target:
+            shutil.copyfileobj(source, target, DOWNLOAD_CHUNK_SIZE)
+        return targetpath
+
+    def _extract_stored_member(
+        self, member: zipfile.ZipInfo, tpath: str
+    ) -> str:
+        """Copy uncompressed member to file using 'os.sendfile'.
+
+        Data are copied by kernel without passing through python buffers.
+        """
+        targetpath = self.get_member_target_path(member, tpath)
+        upperdirs = os.path.dirname(targetpath)
+        if upperdirs:
+            os.makedirs(upperdirs, exist_ok=True)
+
+        archive_fd = self.fp.fileno()
+        # Data start after local file header, filename and extra field
+        header = os.pread(
+            archive_fd, zipfile.sizeFileHeader, member.header_offset
+        )
+        header_values = struct.unpack(zipfile.structFileHeader, header)
+        offset = (
+            member.header_offset
+            + zipfile.sizeFileHeader
+            + header_values[10]
+            + header_values[11]
+        )
+        remaining = member.file_size
+        with open(targetpath, "wb") as target:
+            target_fd = target.fileno()
+            while remaining > 0:
+                sent = os.sendfile(target_fd, archive_fd, offset, remaining)
+                if sent == 0:
+                    raise zipfile.BadZipFile(
+                        f"Truncated data of member '{member.filename}'"
+                    )
+                offset += sent
+                remaining -= sent
+        return targetpath
+
+
+def _new_hash(checksum_algorithm: str) -> "hashlib._Hash":
+    """Create hash object for checksum algorithm.
+
+    Hash object is created using 'hashlib.new' so OpenSSL implementation
+        is used when available. Checksums are used only for integrity
+        validation so 'usedforsecurity' is disabled, which also allows
+        to use 'md5' on FIPS enabled systems.
+
+    Args:
+        checksum_algorithm (str): Algorithm name.
+
+    Returns:
+        hashlib._Hash: Hash object.
+
+    Raises:
+        ValueError: Unknown checksum algorithm.
+
+    """
+    try:
+        return hashlib.new(checksum_algorithm, usedforsecurity=False)
+    except TypeError:
+        # Python 3.8 does not support 'usedforsecurity'
+        return hashlib.new(checksum_algorithm)
 
 
 def calculate_file_checksum(
     filepath: str,
     checksum_algorithm: str,
-    chunk_size: int = 10000,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
 ) -> str:
     """Calculate file checksum for given algorithm.
 
     Args:
         filepath (str): Path to a file.
         checksum_algorithm (str): Algorithm to use. ('md5', 'sha1', 'sha256')
-        chunk_size (int): Chunk size to read file.
-            Defaults to 10000.
+        chunk_size (int): Chunk size to read file if file can't be
+            memory mapped. Defaults to 'DOWNLOAD_CHUNK_SIZE'.
 
     Returns:
         str: Calculated checksum.
@@ -125,22 +605,51 @@ def calculate_file_checksum(
     if not filepath:
         raise ValueError("Filepath is empty.")
 
-    if not os.path.exists(filepath):
-        raise ValueError(f"{filepath} doesn't exist.")
-
-    if not os.path.isfile(filepath):
-        raise ValueError(f"{filepath} is not a file.")
-
-    func = getattr(hashlib, checksum_algorithm, None)
-    if func is None:
+    if checksum_algorithm not in hashlib.algorithms_available:
         raise ValueError(
             f"Unknown checksum algorithm '{checksum_algorithm}'"
         )
 
-    hash_obj = func()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            hash_obj.update(chunk)
+    # File type is checked on opened file, it's the only stat call
+    try:
+        f = open(filepath, "rb", buffering=0)
+    except FileNotFoundError:
+        raise ValueError(f"{filepath} doesn't exist.")
+    except IsADirectoryError:
+        raise ValueError(f"{filepath} is not a file.")
+
+    with f:
+        file_stat = os.fstat(f.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            raise ValueError(f"{filepath} is not a file.")
+        file_size = file_stat.st_size
+        # Let hashlib read smaller files in C (Python 3.11+)
+        if (
+            file_size < MMAP_CHECKSUM_MIN_SIZE
+            and hasattr(hashlib, "file_digest")
+        ):
+            return hashlib.file_digest(
+                f, lambda: _new_hash(checksum_algorithm)
+            ).hexdigest()
+
+        hash_obj = _new_hash(checksum_algorithm)
+        try:
+            # Pass whole file as single buffer to hash implementation,
+            #   GIL is released for the whole update and kernel read-ahead
+            #   fills the mapping
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    m.madvise(mmap.MADV_SEQUENTIAL)
+                hash_obj.update(m)
+        except (ValueError, OSError):
+            # Empty files or files that can't be mapped, reuse one buffer
+            #   to avoid allocation of bytes object per chunk
+            buffer = memoryview(bytearray(chunk_size))
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                hash_obj.update(buffer[:size])
     return hash_obj.hexdigest()
 
 
@@ -179,18 +688,11 @@ def get_archive_ext_and_type(
 
     """
     tmp_name = archive_file.lower()
-    if tmp_name.endswith(".zip"):
-        return ".zip", "zip"
-
-    for ext in (
-        ".tar",
-        ".tgz",
-        ".tar.gz",
-        ".tar.xz",
-        ".tar.bz2",
-    ):
-        if tmp_name.endswith(ext):
-            return ext, "tar"
+    # Single check for most names, exact extension is searched on match
+    if tmp_name.endswith(_ARCHIVE_EXTENSIONS):
+        for ext in _ARCHIVE_EXTENSIONS:
+            if tmp_name.endswith(ext):
+                return ext, _ARCHIVE_EXT_TYPES[ext]
 
     return None, None
 
@@ -221,37 +723,324 @@ def extract_archive_file(
         ))
 
     if archive_type == "zip":
-        zip_file = ZipFileLongPaths(archive_file)
-        zip_file.extractall(dst_folder)
-        zip_file.close()
+        with ZipFileLongPaths(archive_file) as zip_file:
+            zip_file.extract_changed(dst_folder)
+
+    elif archive_type == "tar" and libarchive is not None:
+        _extract_with_libarchive(archive_file, dst_folder)
 
     elif archive_type == "tar":
-        if archive_ext == ".tar":
-            tar_type = "r:"
-        elif archive_ext.endswith(".xz"):
-            tar_type = "r:xz"
-        elif archive_ext.endswith(".gz"):
-            tar_type = "r:gz"
-        elif archive_ext.endswith(".bz2"):
-            tar_type = "r:bz2"
-        else:
-            tar_type = "r:*"
+        # Members are extracted in archive order, stream mode avoids
+        #   seeking in the decompressed data
+        with open(
+            archive_file, "rb", buffering=DOWNLOAD_CHUNK_SIZE
+        ) as stream:
+            # Parallel gzip decompression needs seekable stream, which is
+            #   available only for local file, not during download
+            if (
+                rapidgzip is not None
+                and archive_ext.endswith((".gz", ".tgz"))
+            ):
+                with rapidgzip.RapidgzipFile(
+                    stream, parallelization=os.cpu_count() or 1
+                ) as reader:
+                    extract_tar_stream(reader, ".tar", dst_folder)
+            else:
+                extract_tar_stream(stream, archive_ext, dst_folder)
+
+
+def _extract_with_libarchive(archive_file: str, dst_folder: str):
+    """Extract archive using libarchive.
+
+    Entry paths are prefixed with 'dst_folder' instead of changing current
+        working directory, which is shared by all threads of the process.
+
+    Args:
+        archive_file (str): Path to archive file.
+        dst_folder (str): Directory where content will be extracted.
+
+    """
+    dst_folder = ZipFileLongPaths.to_long_path(os.path.abspath(dst_folder))
+
+    def _prefix_path(path: str) -> str:
+        path = os.path.splitdrive(path)[1].lstrip("/\\")
+        return os.path.join(dst_folder, path)
+
+    def _entries(archive):
+        for entry in archive:
+            entry.pathname = _prefix_path(entry.pathname)
+            if entry.islnk:
+                entry.linkpath = _prefix_path(entry.linkpath)
+            yield entry
+
+    # Absolute paths are created by prefixing, '..' and extraction through
+    #   symlinks is still refused
+    flags = (
+        libarchive.extract.EXTRACT_SECURE_NODOTDOT
+        | libarchive.extract.EXTRACT_SECURE_SYMLINKS
+        | libarchive.extract.EXTRACT_PERM
+        | libarchive.extract.EXTRACT_TIME
+    )
+    with libarchive.file_reader(archive_file) as archive:
+        libarchive.extract.extract_entries(_entries(archive), flags)
+
+
+def _get_tar_mode(archive_ext: str, stream: bool = False) -> str:
+    separator = "|" if stream else ":"
+    if archive_ext in (".tar", ".tzst", ".tar.zst"):
+        compression = ""
+    elif archive_ext.endswith(".xz"):
+        compression = "xz"
+    elif archive_ext.endswith(".gz"):
+        compression = "gz"
+    elif archive_ext.endswith(".bz2"):
+        compression = "bz2"
+    else:
+        compression = "*"
+    return f"r{separator}{compression}"
+
+
+def extract_tar_stream(
+    stream: BinaryIO,
+    archive_ext: str,
+    dst_folder: str,
+):
+    """Extract tar archive from a non-seekable stream.
+
+    Archive members are extracted while the stream is being read, so
+    content can be extracted while it is still being downloaded.
+
+    Zstandard compressed archives ('.tar.zst') are supported only if
+    'zstandard' module is available.
+
+    Content is extracted before checksum of archive is validated, members
+    with absolute paths, '..' components or links pointing outside of
+    'dst_folder' are refused.
+
+    Args:
+        stream (BinaryIO): Stream with archive content.
+        archive_ext (str): Archive extension, e.g. '.tar.gz'.
+        dst_folder (str): Directory where content will be extracted.
+
+    Raises:
+        ValueError: Archive is corrupted or contains unsafe member.
+
+    """
+    if archive_ext.endswith((".zst", ".tzst")):
+        if zstandard is None:
+            raise ValueError(
+                f"Archive format \"{archive_ext}\" requires"
+                " 'zstandard' module which is not available."
+            )
+        decompressor = zstandard.ZstdDecompressor()
+        with decompressor.stream_reader(stream) as reader:
+            extract_tar_stream(reader, ".tar", dst_folder)
+        return
 
+    try:
+        # Default buffers are 10 KiB for reading and 16 KiB for copying
+        #   of members, large buffers lower number of read calls and of
+        #   decompressor calls
+        tar_file = tarfile.open(
+            fileobj=stream,
+            mode=_get_tar_mode(archive_ext, stream=True),
+            bufsize=DOWNLOAD_CHUNK_SIZE,
+            copybufsize=DOWNLOAD_CHUNK_SIZE,
+        )
+    except tarfile.ReadError:
+        raise ValueError("corrupted archive")
+
+    with tar_file:
         try:
-            tar_file = tarfile.open(archive_file, tar_type)
-        except tarfile.ReadError:
-            raise ValueError("corrupted archive")
+            if _TAR_DATA_FILTER is not None:
+                tar_file.extractall(dst_folder, filter=_TAR_DATA_FILTER)
+            else:
+                tar_file.extractall(
+                    dst_folder,
+                    members=_iter_safe_tar_members(tar_file, dst_folder),
+                )
+        except _TAR_FILTER_ERRORS as exc:
+            raise ValueError(f"unsafe archive member: {exc}") from exc
 
-        tar_file.extractall(dst_folder)
-        tar_file.close()
 
+def _iter_safe_tar_members(
+    tar_file: tarfile.TarFile, dst_folder: str
+) -> typing.Iterator[tarfile.TarInfo]:
+    """Yield tar members which are extracted inside destination directory.
 
-def get_addon_settings():
+    Used on Python versions without 'tarfile.data_filter'.
+
+    Args:
+        tar_file (tarfile.TarFile): Opened tar archive.
+        dst_folder (str): Directory where content will be extracted.
+
+    Returns:
+        Iterator[tarfile.TarInfo]: Safe members of archive.
+
+    Raises:
+        ValueError: Member would be extracted outside of 'dst_folder'.
+
+    """
+    dst_root = os.path.realpath(dst_folder)
+
+    def _is_inside(path: str) -> bool:
+        path = os.path.realpath(path)
+        return path == dst_root or path.startswith(dst_root + os.sep)
+
+    for member in tar_file:
+        member_path = os.path.join(dst_root, member.name)
+        if (
+            os.path.isabs(member.name)
+            or not _is_inside(member_path)
+            or member.isdev()
+        ):
+            raise ValueError(f"unsafe archive member: {member.name}")
+
+        if member.issym():
+            link_path = os.path.join(
+                os.path.dirname(member_path), member.linkname
+            )
+        elif member.islnk():
+            link_path = os.path.join(dst_root, member.linkname)
+        else:
+            link_path = None
+
+        if link_path is not None and (
+            os.path.isabs(member.linkname) or not _is_inside(link_path)
+        ):
+            raise ValueError(
+                f"unsafe archive link: {member.name} -> {member.linkname}"
+            )
+        yield member
+
+
+def _move_tree(src_dir: str, dst_dir: str):
+    """Move content of directory to other directory.
+
+    Files already existing in destination are replaced. Symlinks to
+    directories are moved as links, 'os.walk' lists them in directory
+    names but does not walk into them.
+
+    Args:
+        src_dir (str): Source directory.
+        dst_dir (str): Destination directory.
+
+    """
+    for root, dirnames, filenames in os.walk(src_dir):
+        dst_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(dst_root, exist_ok=True)
+        for dirname in dirnames:
+            src_path = os.path.join(root, dirname)
+            if not os.path.islink(src_path):
+                continue
+            dst_path = os.path.join(dst_root, dirname)
+            if os.path.isdir(dst_path) and not os.path.islink(dst_path):
+                shutil.rmtree(dst_path)
+            os.replace(src_path, dst_path)
+
+        for filename in filenames:
+            os.replace(
+                os.path.join(root, filename),
+                os.path.join(dst_root, filename)
+            )
+
+
+def _get_addon_settings() -> Dict[str, Any]:
+    """Cached addon settings.
+
+    Returned object is shared and must not be modified.
+
+    Returns:
+        dict[str, Any]: Addon settings.
+
+    """
     if _ThirdPartyCache.addon_settings is NOT_SET:
-        _ThirdPartyCache.addon_settings = ayon_api.get_addon_settings(
-            ADDON_NAME, __version__
+        addon_settings = _load_persisted_addon_settings()
+        if addon_settings is None:
+            addon_settings = ayon_api.get_addon_settings(
+                ADDON_NAME, __version__
+            )
+            data = _get_addon_settings_context()
+            data["settings"] = addon_settings
+            try:
+                store_file_info("settings", data)
+            except OSError:
+                print("Failed to store addon settings cache")
+        _ThirdPartyCache.addon_settings = addon_settings
+    return _ThirdPartyCache.addon_settings
+
+
+def _get_addon_settings_context() -> Dict[str, Any]:
+    return {
+        "server_url": ayon_api.get_base_url(),
+        "variant": ayon_api.get_default_settings_variant(),
+        "version": __version__,
+    }
+
+
+def _load_persisted_addon_settings() -> Optional[Dict[str, Any]]:
+    """Load addon settings stored by other process.
+
+    Stored settings are used only if they are not older than
+        'ADDON_SETTINGS_TTL' and were stored for the same server, settings
+        variant and addon version.
+
+    Returns:
+        Optional[dict[str, Any]]: Addon settings or None.
+
+    """
+    filepath = _get_info_path("settings")
+    try:
+        age = time.time() - os.path.getmtime(filepath)
+    except OSError:
+        return None
+
+    if not 0 <= age < ADDON_SETTINGS_TTL:
+        return None
+
+    data = filter_file_info("settings")
+    if not isinstance(data, dict):
+        return None
+    for key, value in _get_addon_settings_context().items():
+        if data.get(key) != value:
+            return None
+    return data.get("settings")
+
+
+def get_addon_settings():
+    # Copy is created from pickled settings, which is much faster than
+    #   'copy.deepcopy'. Settings are pickled only once when they change.
+    addon_settings = _get_addon_settings()
+    cached = _ThirdPartyCache.addon_settings_pickle
+    if cached is NOT_SET or cached[0] is not addon_settings:
+        cached = (
+            addon_settings,
+            pickle.dumps(addon_settings, pickle.HIGHEST_PROTOCOL),
+        )
+        _ThirdPartyCache.addon_settings_pickle = cached
+    return pickle.loads(cached[1])
+
+
+def _prime_caches():
+    """Fetch addon settings and server files info at once.
+
+    Both requests are sent in parallel when neither of them is cached, so
+        cold start waits only for the slower one.
+    """
+    settings_missing = _ThirdPartyCache.addon_settings is NOT_SET
+    files_info_missing = not _is_server_files_info_cached()
+    if not (settings_missing and files_info_missing):
+        return
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = (
+            executor.submit(_get_addon_settings),
+            executor.submit(_get_server_files_info),
         )
-    return copy.deepcopy(_ThirdPartyCache.addon_settings)
+        # Failed request is not cached, the error is raised again when
+        #   the data are actually needed
+        for future in futures:
+            future.exception()
 
 
 def get_download_dir(create_if_missing: bool = True) -> str:
@@ -261,36 +1050,207 @@ def get_download_dir(create_if_missing: bool = True) -> str:
     return DOWNLOAD_DIR
 
 
-def _check_args_returncode(args: List[str]) -> bool:
+def _wait_for_process(proc: subprocess.Popen, timeout: float) -> bool:
+    """Wait for process to finish.
+
+    'Popen.wait' with timeout polls the process in a sleep loop. On Linux
+        the process is awaited using pidfd instead, so the wait ends
+        as soon as the process exits.
+
+    Args:
+        proc (subprocess.Popen): Running process.
+        timeout (float): Timeout in seconds.
+
+    Returns:
+        bool: Process finished before timeout.
+
+    """
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pass
+
+    if pidfd is not None:
+        try:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+            if not poller.poll(int(timeout * 1000)):
+                return False
+        finally:
+            os.close(pidfd)
+
     try:
-        kwargs = {}
-        if platform.system().lower() == "windows":
-            kwargs["creationflags"] = (
-                subprocess.CREATE_NEW_PROCESS_GROUP
-                | getattr(subprocess, "DETACHED_PROCESS", 0)
-                | getattr(subprocess, "CREATE_NO_WINDOW", 0)
-            )
+        proc.wait(timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
 
-        if hasattr(subprocess, "DEVNULL"):
-            proc = subprocess.Popen(
-                args,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                **kwargs
-            )
-            proc.wait()
-        else:
-            with open(os.devnull, "w") as devnull:
-                proc = subprocess.Popen(
-                    args, stdout=devnull, stderr=devnull, **kwargs
-                )
-                proc.wait()
 
+def _start_process(args: List[str]) -> Optional[subprocess.Popen]:
+    try:
+        return subprocess.Popen(args, **_POPEN_KWARGS)
     except Exception:
+        return None
+
+
+def _finish_process(proc: subprocess.Popen, timeout: float) -> bool:
+    """Wait for process and check its return code.
+
+    Process is killed if it does not finish in time.
+
+    Args:
+        proc (subprocess.Popen): Running process.
+        timeout (float): Timeout in seconds.
+
+    Returns:
+        bool: Process finished successfully.
+
+    """
+    if not _wait_for_process(proc, timeout):
+        proc.kill()
+        proc.wait()
         return False
     return proc.returncode == 0
 
 
+def _get_validated_args() -> List[str]:
+    if _ThirdPartyCache.validated_args is NOT_SET:
+        validated_args = filter_file_info("validation")
+        if not isinstance(validated_args, list):
+            validated_args = []
+        _ThirdPartyCache.validated_args = validated_args
+    return _ThirdPartyCache.validated_args
+
+
+def _store_validated_args(keys: List[str]):
+    def _merge(validated_args: Any) -> List[str]:
+        # Keys stored by other processes are kept
+        if not isinstance(validated_args, list):
+            validated_args = []
+        validated_args.extend(
+            key for key in keys if key not in validated_args
+        )
+        del validated_args[:-VALIDATION_CACHE_SIZE]
+        return validated_args
+
+    try:
+        validated_args = update_file_info("validation", _merge)
+    except OSError:
+        print("Failed to store tool validation cache")
+        validated_args = _merge(_get_validated_args())
+    _ThirdPartyCache.validated_args = validated_args
+
+
+def _get_validation_keys(
+    args: List[str]
+) -> Tuple[Tuple[Tuple[str, ...], Optional[Tuple[int, int]]], Optional[str]]:
+    """Keys under which validation result of arguments is cached.
+
+    Args:
+        args (list[str]): Arguments to run.
+
+    Returns:
+        tuple[tuple, Optional[str]]: Key of in-process cache and key of
+            persisted cache. Persisted key is None if executable was not
+            found by path.
+
+    """
+    try:
+        file_stat = os.stat(args[0])
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+    except OSError:
+        stat_key = None
+
+    args = tuple(args)
+    persisted_key = None
+    if stat_key is not None:
+        persisted_key = "|".join(
+            args + tuple(str(value) for value in stat_key)
+        )
+    return (args, stat_key), persisted_key
+
+
+def _validate_args_batch(args_list: List[List[str]]) -> List[bool]:
+    """Validate multiple arguments by running them in parallel.
+
+    All processes are started at once so validation takes as long as the
+        slowest process. Results are cached by executable modification
+        time and size. Successful validations of existing executables are
+        also persisted so other processes don't have to run them again.
+
+    Args:
+        args_list (list[list[str]]): Arguments to validate.
+
+    Returns:
+        list[bool]: Validation result for each arguments.
+
+    """
+    results = []
+    running = []
+    for args in args_list:
+        cache_key, persisted_key = _get_validation_keys(args)
+        result = _ThirdPartyCache.validation_results.get(cache_key)
+        if result is None and persisted_key in _get_validated_args():
+            result = True
+
+        if result is None:
+            proc = _start_process(args)
+            if proc is None:
+                result = False
+            else:
+                running.append(
+                    (len(results), cache_key, persisted_key, proc)
+                )
+        else:
+            _ThirdPartyCache.validation_results[cache_key] = result
+        results.append(result)
+
+    new_persisted_keys = []
+    deadline = time.monotonic() + VALIDATION_TIMEOUT
+    for idx, cache_key, persisted_key, proc in running:
+        result = _finish_process(
+            proc, max(deadline - time.monotonic(), 0.0)
+        )
+        results[idx] = result
+        _ThirdPartyCache.validation_results[cache_key] = result
+        if result and persisted_key is not None:
+            new_persisted_keys.append(persisted_key)
+
+    if new_persisted_keys:
+        _store_validated_args(new_persisted_keys)
+    return results
+
+
+def _get_first_valid_args(
+    args_list: List[List[str]], validation_arg: str
+) -> Optional[List[str]]:
+    """Find first valid arguments, all candidates are validated at once.
+
+    Args:
+        args_list (list[list[str]]): Candidate arguments.
+        validation_arg (str): Argument added to validation command.
+
+    Returns:
+        Optional[list[str]]: First valid arguments.
+
+    """
+    args_list = [args for args in args_list if args]
+    results = _validate_args_batch([
+        args + [validation_arg]
+        for args in args_list
+    ])
+    return next(
+        (
+            args
+            for args, result in zip(args_list, results)
+            if result
+        ),
+        None
+    )
+
+
 def validate_ffmpeg_args(args: List[str]) -> bool:
     """Validate ffmpeg arguments.
 
@@ -303,7 +1263,7 @@ def validate_ffmpeg_args(args: List[str]) -> bool:
     """
     if not args:
         return False
-    return _check_args_returncode(args + ["-version"])
+    return _validate_args_batch([args + ["-version"]])[0]
 
 
 def validate_oiio_args(args: List[str]) -> bool:
@@ -318,74 +1278,207 @@ def validate_oiio_args(args: List[str]) -> bool:
     """
     if not args:
         return False
-    return _check_args_returncode(args + ["--help"])
-
-
-def _get_addon_endpoint() -> str:
-    return f"addons/{ADDON_NAME}/{__version__}"
+    return _validate_args_batch([args + ["--help"]])[0]
 
 
+@lru_cache(maxsize=None)
 def _get_info_path(name: str) -> str:
     return get_launcher_storage_dir(
         "addons", f"{ADDON_NAME}-{name}.json"
     )
 
 
+def _get_file_stat_key(filepath: str) -> Optional[Tuple[int, int]]:
+    try:
+        file_stat = os.stat(filepath)
+    except OSError:
+        return None
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
 def filter_file_info(name: str) -> List["ToolInfo"]:
+    """Load info file.
+
+    Parsed content is cached and parsed again only if modification time
+        or size of the file changed. Cache is stored pickled and each call
+        returns new copy, so callers can modify returned data.
+
+    Args:
+        name (str): Name of info file.
+
+    Returns:
+        List[ToolInfo]: Content of info file.
+
+    """
     filepath = _get_info_path(name)
+    stat_key = _get_file_stat_key(filepath)
+    if stat_key is None:
+        _ThirdPartyCache.file_info.pop(name, None)
+        return []
+
+    cached = _ThirdPartyCache.file_info.get(name)
+    if cached is not None and cached[0] == stat_key:
+        return pickle.loads(cached[1])
+
     try:
-        if os.path.exists(filepath):
-            with open(filepath, "r") as stream:
-                return json.load(stream)
+        info = _read_json(filepath)
     except Exception:
         print(f"Failed to load {name} info from {filepath}")
-    return []
+        return []
+    _ThirdPartyCache.file_info[name] = (
+        stat_key, pickle.dumps(info, pickle.HIGHEST_PROTOCOL)
+    )
+    return info
 
 
 def store_file_info(name: str, info: List["ToolInfo"]):
     filepath = _get_info_path(name)
     root, filename = os.path.split(filepath)
     os.makedirs(root, exist_ok=True)
-    with open(filepath, "w") as stream:
-        json.dump(info, stream)
+    # Serialize writers from multiple processes
+    with _file_lock(f"{filepath}.lock"):
+        _atomic_write_json(filepath, info)
+        stat_key = _get_file_stat_key(filepath)
+    _set_file_info_cache(name, stat_key, info)
+
+
+def update_file_info(
+    name: str, update_func: Callable[[Any], Any]
+) -> Any:
+    """Change content of info file under lock shared by processes.
+
+    Current content is read after the lock is acquired, so changes stored
+        by other processes in the meantime are not lost.
+
+    Args:
+        name (str): Name of info file.
+        update_func (Callable[[Any], Any]): Function which receives
+            current content and returns new content.
+
+    Returns:
+        Any: Stored content.
+
+    """
+    filepath = _get_info_path(name)
+    root, filename = os.path.split(filepath)
+    os.makedirs(root, exist_ok=True)
+    # Serialize writers from multiple processes
+    with _file_lock(f"{filepath}.lock"):
+        info = update_func(filter_file_info(name))
+        _atomic_write_json(filepath, info)
+        stat_key = _get_file_stat_key(filepath)
+    _set_file_info_cache(name, stat_key, info)
+    return info
+
+
+def _set_file_info_cache(
+    name: str, stat_key: Optional[Tuple[int, int]], info: Any
+):
+    if stat_key is None:
+        _ThirdPartyCache.file_info.pop(name, None)
+    else:
+        _ThirdPartyCache.file_info[name] = (
+            stat_key, pickle.dumps(info, pickle.HIGHEST_PROTOCOL)
+        )
+
+
+def get_downloaded_ffmpeg_info() -> List["ToolInfo"]:
+    return filter_file_info("ffmpeg")
+
+
+def store_downloaded_ffmpeg_info(ffmpeg_info: List["ToolInfo"]):
+    store_file_info("ffmpeg", ffmpeg_info)
+
+
+def get_downloaded_oiio_info() -> List["ToolInfo"]:
+    return filter_file_info("oiio")
+
+
+def store_downloaded_oiio_info(oiio_info: List["ToolInfo"]):
+    store_file_info("oiio", oiio_info)
+
+
+def get_server_files_info() -> List["ToolDownloadInfo"]:
+    """Receive zip file info from server.
+
+    Information must contain at least 'filename' and 'hash' with md5 zip
+    file hash.
+
+    Returns:
+        list[dict[str, str]]: Information about files on server.
+
+    """
+    return [
+        dict(file_info)
+        for file_info in _get_server_files_info()
+    ]
+
 
+def _get_server_files_info() -> List["ToolDownloadInfo"]:
+    """Cached information about files on server.
 
-def get_downloaded_ffmpeg_info() -> List["ToolInfo"]:
-    return filter_file_info("ffmpeg")
+    Returned object is shared and must not be modified.
 
+    Returns:
+        list[dict[str, str]]: Information about files on server.
 
-def store_downloaded_ffmpeg_info(ffmpeg_info: List["ToolInfo"]):
-    store_file_info("ffmpeg", ffmpeg_info)
+    """
+    if not _is_server_files_info_cached():
+        response = ayon_api.get(f"{_ADDON_ENDPOINT}/files_info")
+        response.raise_for_status()
+        _ThirdPartyCache.server_files_info = response.data
+        _ThirdPartyCache.server_files_info_time = time.monotonic()
+        _ThirdPartyCache.files_info_index = NOT_SET
+    return _ThirdPartyCache.server_files_info
 
 
-def get_downloaded_oiio_info() -> List["ToolInfo"]:
-    return filter_file_info("oiio")
+def _is_server_files_info_cached() -> bool:
+    if _ThirdPartyCache.server_files_info is NOT_SET:
+        return False
+    age = time.monotonic() - _ThirdPartyCache.server_files_info_time
+    return age < SERVER_FILES_INFO_TTL
 
 
-def store_downloaded_oiio_info(oiio_info: List["ToolInfo"]):
-    store_file_info("oiio", oiio_info)
+def _invalidate_server_files_info():
+    _ThirdPartyCache.server_files_info = NOT_SET
+    _ThirdPartyCache.files_info_index = NOT_SET
 
 
-def get_server_files_info() -> List["ToolDownloadInfo"]:
-    """Receive zip file info from server.
+def _index_files_info(
+    files_info: List["ToolDownloadInfo"]
+) -> Dict[Tuple[str, str], "ToolDownloadInfo"]:
+    """Index files info by name and platform.
 
-    Information must contain at least 'filename' and 'hash' with md5 zip
-    file hash.
+    If there are more files for the same name and platform, the one with
+        the most preferred checksum algorithm is used.
+
+    Args:
+        files_info (List[ToolDownloadInfo]): List of file info dicts.
 
     Returns:
-        list[dict[str, str]]: Information about files on server.
+        dict[tuple[str, str], ToolDownloadInfo]: File info by name and
+            platform.
 
     """
-    endpoint = _get_addon_endpoint()
-    response = ayon_api.get(f"{endpoint}/files_info")
-    response.raise_for_status()
-    return response.data
+    def _rank(file_info):
+        algorithm = file_info["checksum_algorithm"]
+        if algorithm in PREFERRED_CHECKSUM_ALGORITHMS:
+            return PREFERRED_CHECKSUM_ALGORITHMS.index(algorithm)
+        return len(PREFERRED_CHECKSUM_ALGORITHMS)
+
+    output = {}
+    for file_info in files_info:
+        key = (file_info["name"], file_info["platform"])
+        current = output.get(key)
+        if current is None or _rank(file_info) < _rank(current):
+            output[key] = file_info
+    return output
 
 
 def _find_file_info(
     name: str, files_info: List["ToolDownloadInfo"]
 ) -> Optional["ToolDownloadInfo"]:
-    """Find file info by name.
+    """Find file info by name for current platform.
 
     Args:
         name (str): Name of file to find.
@@ -395,32 +1488,33 @@ def _find_file_info(
         Optional[ToolDownloadInfo]: File info data.
 
     """
-    platform_name = platform.system().lower()
-    return next(
-        (
-            file_info
-            for file_info in files_info
-            if (
-                file_info["name"] == name
-                and file_info["platform"] == platform_name
+    if files_info is _ThirdPartyCache.server_files_info:
+        if _ThirdPartyCache.files_info_index is NOT_SET:
+            _ThirdPartyCache.files_info_index = _index_files_info(
+                files_info
             )
-        ),
-        None
-    )
+        files_info_index = _ThirdPartyCache.files_info_index
+    else:
+        files_info_index = _index_files_info(files_info)
+    return files_info_index.get((name, PLATFORM_NAME))
 
 
 def get_downloaded_ffmpeg_root() -> Optional[str]:
     if _FFmpegArgs.downloaded_root is not NOT_SET:
         return _FFmpegArgs.downloaded_root
 
-    server_ffmpeg_info = _find_file_info("ffmpeg", get_server_files_info())
+    server_ffmpeg_info = _find_file_info("ffmpeg", _get_server_files_info())
     root = None
     if server_ffmpeg_info:
         for existing_info in get_downloaded_ffmpeg_info():
             if existing_info["checksum"] != server_ffmpeg_info["checksum"]:
                 continue
             found_root = existing_info["root"]
-            if os.path.exists(found_root):
+            # Sizes from manifest are compared instead of checksum of files
+            if (
+                os.path.exists(found_root)
+                and _validate_distribution_manifest(found_root)
+            ):
                 root = found_root
                 break
 
@@ -432,20 +1526,74 @@ def get_downloaded_oiio_root() -> Optional[str]:
     if _OIIOArgs.downloaded_root is not NOT_SET:
         return _OIIOArgs.downloaded_root
 
-    server_oiio_info = _find_file_info("oiio", get_server_files_info())
+    server_oiio_info = _find_file_info("oiio", _get_server_files_info())
     root = None
     if server_oiio_info:
         for existing_info in get_downloaded_oiio_info():
             if existing_info["checksum"] != server_oiio_info["checksum"]:
                 continue
             found_root = existing_info["root"]
-            if os.path.exists(found_root):
+            # Sizes from manifest are compared instead of checksum of files
+            if (
+                os.path.exists(found_root)
+                and _validate_distribution_manifest(found_root)
+            ):
                 root = found_root
                 break
     _OIIOArgs.downloaded_root = root
     return _OIIOArgs.downloaded_root
 
 
+@lru_cache(maxsize=None)
+def _get_downloaded_tool_path(
+    root: str, tool_name: str, subpath: Tuple[str, ...]
+) -> str:
+    """Path to downloaded tool executable.
+
+    Args:
+        root (str): Root of downloaded tool.
+        tool_name (str): Name of tool.
+        subpath (tuple[str, ...]): Path parts relative to root, tool name
+            is filled to '{}'.
+
+    Returns:
+        str: Path to executable.
+
+    """
+    return os.path.join(
+        root, *(part.format(tool_name) for part in subpath)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_existing_roots(custom_roots: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Fill environment variables to roots and keep only existing.
+
+    Result is cached so roots are formatted and checked only once for all
+        tools. Cache is cleared by 'invalidate_download_needed_cache'.
+
+    Args:
+        custom_roots (tuple[str, ...]): Roots from settings.
+
+    Returns:
+        tuple[str, ...]: Existing directories.
+
+    """
+    filtered_roots = []
+    for root in custom_roots:
+        if not root:
+            continue
+        if "{" in root:
+            try:
+                root = root.format_map(os.environ)
+            except (ValueError, KeyError):
+                print(f"Failed to format root '{root}'")
+
+        if os.path.isdir(root):
+            filtered_roots.append(root)
+    return tuple(filtered_roots)
+
+
 def _fill_ffmpeg_tool_args(
     tool_name: "FFmpegToolname",
     addon_settings: Optional[Dict[str, Any]] = None,
@@ -457,57 +1605,45 @@ def _fill_ffmpeg_tool_args(
         )
 
     if addon_settings is None:
-        addon_settings = get_addon_settings()
-    platform_name = platform.system().lower()
+        addon_settings = _get_addon_settings()
     ffmpeg_settings = addon_settings["ffmpeg"]
     if ffmpeg_settings["use_downloaded"]:
         if is_ffmpeg_download_needed(addon_settings):
             download_ffmpeg()
 
-        path_parts = [get_downloaded_ffmpeg_root()]
-        if platform_name == "windows":
-            path_parts.append("bin")
-            tool_name = f"{tool_name}.exe"
-        path_parts.append(tool_name)
-
-        args = [
-            os.path.sep.join(path_parts)
-        ]
-        if not validate_ffmpeg_args(args):
-            args = None
+        args = None
+        root = get_downloaded_ffmpeg_root()
+        # Root is not available when download or extraction failed
+        if root:
+            tool_path = _get_downloaded_tool_path(
+                root, tool_name, _FFMPEG_TOOL_SUBPATH
+            )
+            # Downloaded archive was validated by checksum, don't run the tool
+            if os.path.isfile(tool_path):
+                args = [tool_path]
         _FFmpegArgs.tools[tool_name] = args
         return args
 
-    for custom_args in ffmpeg_settings["custom_args"][tool_name]:
-        if custom_args and validate_ffmpeg_args(custom_args):
-            _FFmpegArgs.tools[tool_name] = custom_args
-            return custom_args
+    custom_args = _get_first_valid_args(
+        ffmpeg_settings["custom_args"][tool_name], "-version"
+    )
+    if custom_args:
+        _FFmpegArgs.tools[tool_name] = custom_args
+        return custom_args
 
-    custom_roots = list(
+    filtered_roots = _get_existing_roots(tuple(
         ffmpeg_settings
         ["custom_roots"]
-        [platform_name]
+        [PLATFORM_NAME]
+    ))
+
+    final_args = _get_first_valid_args(
+        [
+            [os.path.join(root, tool_name)]
+            for root in filtered_roots
+        ],
+        "-version"
     )
-    filtered_roots = []
-    format_data = dict(os.environ.items())
-    for root in custom_roots:
-        if not root:
-            continue
-        try:
-            root = root.format(**format_data)
-        except (ValueError, KeyError):
-            print("Failed to format root '{}'".format(root))
-
-        if os.path.exists(root):
-            filtered_roots.append(root)
-
-    final_args = None
-    for root in filtered_roots:
-        tool_path = os.path.join(root, tool_name)
-        args = [tool_path]
-        if validate_ffmpeg_args(args):
-            final_args = args
-            break
     _FFmpegArgs.tools[tool_name] = final_args
     return final_args
 
@@ -523,63 +1659,62 @@ def _fill_oiio_tool_args(
         )
 
     if addon_settings is None:
-        addon_settings = get_addon_settings()
+        addon_settings = _get_addon_settings()
 
-    platform_name = platform.system().lower()
     oiio_settings = addon_settings["oiio"]
     if oiio_settings["use_downloaded"]:
         if is_oiio_download_needed(addon_settings):
             download_oiio()
 
-        path_parts = [get_downloaded_oiio_root()]
-        if platform_name == "linux":
-            path_parts.append("bin")
-        elif platform_name == "windows":
-            tool_name = f"{tool_name}.exe"
-        path_parts.append(tool_name)
-
-        args = [
-            os.path.sep.join(path_parts)
-        ]
-        if not validate_oiio_args(args):
-            args = None
+        args = None
+        root = get_downloaded_oiio_root()
+        # Root is not available when download or extraction failed
+        if root:
+            tool_path = _get_downloaded_tool_path(
+                root, tool_name, _OIIO_TOOL_SUBPATH
+            )
+            if os.path.isfile(tool_path):
+                args = [tool_path]
         _OIIOArgs.tools[tool_name] = args
         return args
 
-    for custom_args in oiio_settings["custom_args"][tool_name]:
-        if custom_args and validate_oiio_args(custom_args):
-            _OIIOArgs.tools[tool_name] = custom_args
-            return custom_args
+    custom_args = _get_first_valid_args(
+        oiio_settings["custom_args"][tool_name], "--help"
+    )
+    if custom_args:
+        _OIIOArgs.tools[tool_name] = custom_args
+        return custom_args
 
-    custom_roots = list(
+    filtered_roots = _get_existing_roots(tuple(
         oiio_settings
         ["custom_roots"]
-        [platform_name]
+        [PLATFORM_NAME]
+    ))
+
+    final_args = _get_first_valid_args(
+        [
+            [os.path.join(root, tool_name)]
+            for root in filtered_roots
+        ],
+        "--help"
     )
-    filtered_roots = []
-    format_data = dict(os.environ.items())
-    for root in custom_roots:
-        if not root:
-            continue
-        try:
-            root = root.format(**format_data)
-        except (ValueError, KeyError):
-            print(f"Failed to format root '{root}'")
-
-        if os.path.exists(root):
-            filtered_roots.append(root)
-
-    final_args = None
-    for root in filtered_roots:
-        tool_path = os.path.join(root, tool_name)
-        args = [tool_path]
-        if validate_oiio_args(args):
-            final_args = args
-            break
     _OIIOArgs.tools[tool_name] = final_args
     return final_args
 
 
+def invalidate_download_needed_cache():
+    """Reset cached results of download checks.
+
+    Results of 'is_ffmpeg_download_needed' and 'is_oiio_download_needed'
+    are cached for lifetime of the process. Next call after invalidation
+    will look for downloaded roots and existing custom roots again.
+    """
+    for args_cache in (_FFmpegArgs, _OIIOArgs):
+        args_cache.download_needed = None
+        args_cache.downloaded_root = NOT_SET
+    _get_existing_roots.cache_clear()
+
+
 def is_ffmpeg_download_needed(
     addon_settings: Optional[Dict[str, Any]] = None
 ) -> bool:
@@ -592,8 +1727,9 @@ def is_ffmpeg_download_needed(
     if _FFmpegArgs.download_needed is not None:
         return _FFmpegArgs.download_needed
 
+    _prime_caches()
     if addon_settings is None:
-        addon_settings = get_addon_settings()
+        addon_settings = _get_addon_settings()
     ffmpeg_settings = addon_settings["ffmpeg"]
     download_needed = False
     if ffmpeg_settings["use_downloaded"]:
@@ -617,8 +1753,9 @@ def is_oiio_download_needed(
     if _OIIOArgs.download_needed is not None:
         return _OIIOArgs.download_needed
 
+    _prime_caches()
     if addon_settings is None:
-        addon_settings = get_addon_settings()
+        addon_settings = _get_addon_settings()
     oiio_settings = addon_settings["oiio"]
 
     download_needed = False
@@ -629,6 +1766,479 @@ def is_oiio_download_needed(
     return _OIIOArgs.download_needed
 
 
+def _get_http_session() -> requests.Session:
+    """Session shared by all downloads of the process.
+
+    Connections are kept alive and reused by the HEAD probe and all range
+    requests instead of opening new TCP and TLS connection for each.
+    """
+    if _ThirdPartyCache.http_session is None:
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=DOWNLOAD_CONNECTIONS * 2
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _ThirdPartyCache.http_session = session
+    return _ThirdPartyCache.http_session
+
+
+def _preallocate_file(stream: BinaryIO, size: int):
+    """Allocate disk space for file at once.
+
+    Avoids extending file on each written chunk.
+    """
+    if not size:
+        return
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(stream.fileno(), 0, size)
+            return
+        except OSError:
+            # Filesystem does not support it
+            pass
+    stream.truncate(size)
+
+
+def _advise_sequential(stream: BinaryIO):
+    """Tell OS that file will be read sequentially to use read-ahead."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(
+            stream.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+        )
+
+
+class _RangesNotSupported(Exception):
+    """Server did respond with full content to a range request."""
+
+
+def _read_download_meta(meta_path: str) -> Dict[str, Any]:
+    try:
+        if os.path.exists(meta_path):
+            return _read_json(meta_path)
+    except Exception:
+        print(f"Failed to load download metadata from {meta_path}")
+    return {}
+
+
+def _store_download_meta(meta_path: str, meta: Dict[str, Any]):
+    _atomic_write_json(meta_path, meta)
+
+
+class _DownloadState:
+    """Shared state of a download persisted next to '.part' file.
+
+    Each segment is stored as '[start, position, end]' where position
+    is offset up to which data were already written to the '.part' file.
+
+    Positions are persisted only every 'DOWNLOAD_META_STORE_SIZE' bytes
+    or 'DOWNLOAD_META_STORE_INTERVAL' seconds, and when download stops.
+    Stored positions may lag behind, resume then downloads the data again.
+
+    Args:
+        meta_path (str): Path to '.part.meta' sidecar file.
+        meta (dict[str, Any]): Download metadata with segments.
+        progress (TransferProgress): Keep track about download.
+
+    """
+    def __init__(
+        self,
+        meta_path: str,
+        meta: Dict[str, Any],
+        progress: TransferProgress,
+    ):
+        self._meta_path = meta_path
+        self._meta = meta
+        self._progress = progress
+        self._condition = threading.Condition()
+        self._store_lock = threading.Lock()
+        self._unstored_size = 0
+        self._last_store_time = time.monotonic()
+        self._done = False
+
+    @property
+    def segments(self) -> List[List[Optional[int]]]:
+        return self._meta["segments"]
+
+    def set_segments(self, segments: List[List[Optional[int]]]):
+        with self._condition:
+            self._meta["segments"] = segments
+            self._progress.set_transferred_size(0)
+        self.store()
+
+    def commit(self, segment: List[Optional[int]], size: int):
+        with self._condition:
+            segment[1] += size
+            self._progress.add_transferred_chunk(size)
+            self._unstored_size += size
+            store = (
+                self._unstored_size >= DOWNLOAD_META_STORE_SIZE
+                or (
+                    time.monotonic() - self._last_store_time
+                    >= DOWNLOAD_META_STORE_INTERVAL
+                )
+            )
+            self._condition.notify_all()
+        if store:
+            self.store()
+
+    def reset_segment(self, segment: List[Optional[int]]):
+        with self._condition:
+            self._progress.set_transferred_size(
+                self._progress.transferred_size - (segment[1] - segment[0])
+            )
+            segment[1] = segment[0]
+        self.store()
+
+    def store(self):
+        """Persist current positions of segments to meta file.
+
+        Snapshot is taken under the shared condition but written outside
+        of it, so download threads are not blocked by disk writes.
+        """
+        with self._store_lock:
+            with self._condition:
+                meta = dict(self._meta)
+                meta["segments"] = [
+                    list(segment) for segment in self.segments
+                ]
+                self._unstored_size = 0
+                self._last_store_time = time.monotonic()
+            _store_download_meta(self._meta_path, meta)
+
+    def set_done(self):
+        with self._condition:
+            self._done = True
+            self._condition.notify_all()
+        self.store()
+
+    def wait_for_data(self, position: int) -> int:
+        """Wait until data at position are written to '.part' file.
+
+        Args:
+            position (int): Offset in file.
+
+        Returns:
+            int: Number of bytes available from the offset, 0 at the end
+                of file or when download did stop.
+
+        """
+        with self._condition:
+            while True:
+                segment = next(
+                    (
+                        segment
+                        for segment in self.segments
+                        if segment[0] <= position and (
+                            segment[2] is None or position <= segment[2]
+                        )
+                    ),
+                    None
+                )
+                if segment is None:
+                    return 0
+                available = segment[1] - position
+                if available > 0:
+                    return available
+                if self._done:
+                    return 0
+                self._condition.wait()
+
+
+class _PartFileReader(io.RawIOBase):
+    """Sequential reader of '.part' file which is being downloaded.
+
+    Reading blocks until requested data are downloaded. Read data are
+    passed to hash object if is set.
+    """
+    def __init__(
+        self,
+        part_path: str,
+        state: _DownloadState,
+        hash_obj: Optional[Any] = None,
+    ):
+        super().__init__()
+        self._stream = open(part_path, "rb")
+        _advise_sequential(self._stream)
+        self._state = state
+        self._hash_obj = hash_obj
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        available = self._state.wait_for_data(self._position)
+        if not available:
+            return 0
+        view = memoryview(buffer)[:available]
+        self._stream.seek(self._position)
+        size = self._stream.readinto(view)
+        self._position += size
+        if self._hash_obj is not None:
+            self._hash_obj.update(view[:size])
+        return size
+
+    def close(self):
+        self._stream.close()
+        super().close()
+
+
+def _download_segment(
+    url: str,
+    part_path: str,
+    segment: List[Optional[int]],
+    state: _DownloadState,
+    headers: Dict[str, str],
+    request_kwargs: Dict[str, Any],
+):
+    start, position, end = segment
+    ranged = len(state.segments) > 1
+    segment_headers = dict(headers)
+    if ranged or position > 0:
+        end_str = "" if end is None else str(end)
+        segment_headers["Range"] = f"bytes={position}-{end_str}"
+
+    with _get_http_session().get(
+        url, headers=segment_headers, stream=True, **request_kwargs
+    ) as response:
+        response.raise_for_status()
+        if "Range" in segment_headers and response.status_code != 206:
+            if ranged:
+                raise _RangesNotSupported()
+            # Server sent whole content, start over
+            state.reset_segment(segment)
+            position = 0
+
+        with open(part_path, "r+b") as stream:
+            stream.seek(position)
+            # Size of preallocated file is already correct
+            if end is None:
+                stream.truncate()
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                stream.write(chunk)
+                stream.flush()
+                state.commit(segment, len(chunk))
+
+
+def _consume_part_file(
+    part_path: str,
+    state: _DownloadState,
+    stream_callback: Optional[Callable[[BinaryIO], None]],
+    hash_obj: Optional[Any],
+):
+    with io.BufferedReader(
+        _PartFileReader(part_path, state, hash_obj), DOWNLOAD_CHUNK_SIZE
+    ) as stream:
+        if stream_callback is not None:
+            stream_callback(stream)
+        # Make sure whole content went through hash object
+        if hash_obj is not None:
+            while stream.read(DOWNLOAD_CHUNK_SIZE):
+                pass
+
+
+def download_ranged(
+    url: str,
+    filepath: str,
+    progress: Optional[TransferProgress] = None,
+    connections: int = DOWNLOAD_CONNECTIONS,
+    headers: Optional[Dict[str, str]] = None,
+    stream_callback: Optional[Callable[[BinaryIO], None]] = None,
+    checksum_algorithm: Optional[str] = None,
+    **request_kwargs
+) -> Optional[str]:
+    """Download file using multiple concurrent range requests.
+
+    Server is asked with HEAD request if it supports byte ranges. If it
+    does, content is split to 'connections' segments which are downloaded
+    in parallel and written directly at their offset in output file.
+    Falls back to single stream download if ranges are not supported or
+    HEAD request failed.
+
+    Data are written to '{filepath}.part' and written offsets are stored
+    to '{filepath}.part.meta'. Interrupted download is resumed from those
+    offsets if server reports the same 'ETag' or 'Last-Modified' value.
+    The '.part' file is renamed to 'filepath' once download is finished.
+
+    Downloaded content can be consumed while download is running with
+    'stream_callback'. It is called in a separate thread with a readable
+    stream that returns file content in order as soon as it is written.
+    The same in-order read is used to calculate checksum of the content
+    if 'checksum_algorithm' is passed, so the file doesn't have to be
+    read again after download.
+
+    Args:
+        url (str): Url of file to download.
+        filepath (str): Path where file will be stored.
+        progress (Optional[TransferProgress]): Keep track about download.
+        connections (int): Number of concurrent connections.
+        headers (Optional[dict[str, str]]): Headers used for requests.
+        stream_callback (Optional[Callable[[BinaryIO], None]]): Callback
+            consuming downloaded content while it's being downloaded.
+        checksum_algorithm (Optional[str]): Algorithm used to calculate
+            checksum of downloaded content.
+        **request_kwargs: Additional kwargs passed to 'requests' calls.
+
+    Returns:
+        Optional[str]: Checksum of downloaded file if 'checksum_algorithm'
+            was passed.
+
+    """
+    if progress is None:
+        progress = TransferProgress()
+
+    if headers is None:
+        headers = {}
+
+    part_path = f"{filepath}.part"
+    meta_path = f"{part_path}.meta"
+
+    progress.set_source_url(url)
+    progress.set_destination_url(filepath)
+    progress.set_started()
+    try:
+        # HEAD is only a probe, some servers don't allow it (e.g. 405)
+        #   so download falls back to single stream without known size
+        response_headers = {}
+        try:
+            response = _get_http_session().head(
+                url, headers=headers, allow_redirects=True, **request_kwargs
+            )
+            if response.ok:
+                response_headers = response.headers
+        except requests.RequestException:
+            pass
+        content_size = int(response_headers.get("Content-Length") or 0)
+        accept_ranges = response_headers.get("Accept-Ranges") == "bytes"
+        validator = (
+            response_headers.get("ETag")
+            or response_headers.get("Last-Modified")
+        )
+
+        meta = _read_download_meta(meta_path)
+        can_resume = (
+            accept_ranges
+            and validator
+            and meta.get("validator") == validator
+            and meta.get("size") == content_size
+            and os.path.exists(part_path)
+        )
+        if not can_resume:
+            use_ranges = (
+                connections > 1
+                and accept_ranges
+                and content_size >= RANGED_DOWNLOAD_MIN_SIZE
+            )
+            # Size is not known, download everything in single stream
+            segments = [[0, 0, None]]
+            if content_size:
+                segments_count = connections if use_ranges else 1
+                segment_size = -(-content_size // segments_count)
+                segments = [
+                    [
+                        start,
+                        start,
+                        min(start + segment_size, content_size) - 1
+                    ]
+                    for start in range(0, content_size, segment_size)
+                ]
+
+            meta = {
+                "validator": validator,
+                "size": content_size,
+                "segments": segments,
+            }
+            with open(part_path, "wb") as stream:
+                _preallocate_file(stream, content_size)
+            _store_download_meta(meta_path, meta)
+
+        if content_size:
+            progress.set_content_size(content_size)
+        state = _DownloadState(meta_path, meta, progress)
+        progress.set_transferred_size(sum(
+            position - start
+            for start, position, _ in state.segments
+        ))
+        pending_segments = [
+            segment
+            for segment in state.segments
+            if segment[2] is None or segment[1] <= segment[2]
+        ]
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(pending_segments) + 1
+            ) as executor:
+                hash_obj = None
+                if checksum_algorithm:
+                    hash_obj = _new_hash(checksum_algorithm)
+
+                consumer_future = None
+                if stream_callback is not None or hash_obj is not None:
+                    consumer_future = executor.submit(
+                        _consume_part_file,
+                        part_path,
+                        state,
+                        stream_callback,
+                        hash_obj,
+                    )
+
+                try:
+                    futures = [
+                        executor.submit(
+                            _download_segment,
+                            url,
+                            part_path,
+                            segment,
+                            state,
+                            headers,
+                            request_kwargs,
+                        )
+                        for segment in pending_segments
+                    ]
+                    try:
+                        for future in futures:
+                            future.result()
+
+                    except _RangesNotSupported:
+                        for future in futures:
+                            future.exception()
+                        state.set_segments([[0, 0, None]])
+                        _download_segment(
+                            url,
+                            part_path,
+                            state.segments[0],
+                            state,
+                            headers,
+                            request_kwargs,
+                        )
+
+                finally:
+                    state.set_done()
+
+                if consumer_future is not None:
+                    consumer_future.result()
+
+        except BaseException:
+            # Other segments were still written when first of them failed,
+            #   store their final positions once all of them stopped
+            state.store()
+            raise
+
+        os.replace(part_path, filepath)
+        os.remove(meta_path)
+        if hash_obj is not None:
+            return hash_obj.hexdigest()
+        return None
+
+    except Exception as exc:
+        progress.set_failed(str(exc))
+        raise
+
+    finally:
+        progress.set_transfer_done()
+
+
 def _download_file(
     file_info: "ToolDownloadInfo",
     dirpath: str,
@@ -638,108 +2248,353 @@ def _download_file(
     checksum = file_info["checksum"]
     checksum_algorithm = file_info["checksum_algorithm"]
 
-    zip_filepath = ayon_api.download_addon_private_file(
-        ADDON_NAME,
-        __version__,
-        filename,
-        dirpath,
-        progress=progress
-    )
+    con = ayon_api.get_server_api_connection()
+    endpoint = f"{_ADDON_ENDPOINT}/private/{filename}"
+    os.makedirs(dirpath, exist_ok=True)
+    zip_filepath = os.path.join(dirpath, filename)
+
+    # Tar archives can be extracted while they are downloaded. Content is
+    #   extracted to a staging directory and moved to 'dirpath' only when
+    #   checksum of the archive is valid.
+    staging_dir = None
+    stream_callback = None
+    archive_ext, archive_type = get_archive_ext_and_type(filename)
+    if archive_type == "tar":
+        staging_dir = tempfile.mkdtemp(
+            prefix=f".{os.path.basename(dirpath)}-",
+            dir=os.path.dirname(dirpath),
+        )
+        stream_callback = partial(
+            extract_tar_stream,
+            archive_ext=archive_ext,
+            dst_folder=staging_dir,
+        )
 
     try:
-        if not validate_file_checksum(
-            zip_filepath, checksum, checksum_algorithm
-        ):
+        file_checksum = download_ranged(
+            f"{con.get_base_url()}/api/{endpoint}",
+            zip_filepath,
+            progress=progress,
+            headers=con.get_headers(),
+            stream_callback=stream_callback,
+            checksum_algorithm=checksum_algorithm,
+            verify=con.ssl_verify,
+            cert=con.cert,
+        )
+        if file_checksum != checksum:
             raise ValueError(
                 "Downloaded file hash does not match expected hash"
             )
-        extract_archive_file(zip_filepath, dirpath)
+        if staging_dir is None:
+            extract_archive_file(zip_filepath, dirpath)
+        else:
+            _move_tree(staging_dir, dirpath)
+        os.remove(zip_filepath)
+        _store_distribution_manifest(dirpath)
 
     finally:
-        os.remove(zip_filepath)
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir)
+        if os.path.exists(zip_filepath):
+            os.remove(zip_filepath)
 
 
-def download_ffmpeg(progress: Optional[TransferProgress] = None):
-    """Download ffmpeg from server.
+def _distribution_lock(dirpath: str):
+    """Lock distribution of a tool directory across processes.
+
+    Args:
+        dirpath (str): Directory where tool is distributed. Parent
+            directory must exist.
+
+    Returns:
+        ContextManager: Exclusive lock on '<dirpath>.lock'.
+
+    """
+    return _file_lock(f"{dirpath}.lock")
 
-    Todos:
-        Add safeguard to avoid downloading of the file from multiple
-            processes at once.
+
+def _collect_file_sizes(dirpath: str) -> Dict[str, int]:
+    """Collect sizes of files in directory recursively.
 
     Args:
-        progress (ayon_api.TransferProgress): Keep track about download.
+        dirpath (str): Directory to walk.
+
+    Returns:
+        dict[str, int]: Size of files by path relative to 'dirpath'.
 
     """
-    dirpath = os.path.join(get_download_dir(), "ffmpeg")
+    skipped = {EXTRACT_MANIFEST_FILENAME, DISTRIBUTION_MANIFEST_FILENAME}
+    output = {}
+    stack = [("", dirpath)]
+    while stack:
+        rel_dir, current_dir = stack.pop()
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                rel_path = f"{rel_dir}{entry.name}"
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((f"{rel_path}/", entry.path))
+                elif not rel_dir and entry.name in skipped:
+                    continue
+                else:
+                    output[rel_path] = entry.stat(
+                        follow_symlinks=False
+                    ).st_size
+    return output
+
+
+def _store_distribution_manifest(dirpath: str):
+    manifest_path = os.path.join(dirpath, DISTRIBUTION_MANIFEST_FILENAME)
+    _atomic_write_json(manifest_path, _collect_file_sizes(dirpath))
+
+
+def _validate_distribution_manifest(dirpath: str) -> bool:
+    """Validate distributed files against manifest.
+
+    Directories distributed before manifest was introduced are considered
+        valid.
 
-    files_info = get_server_files_info()
-    file_info = _find_file_info("ffmpeg", files_info)
-    if file_info is None:
-        raise ValueError((
-            "Couldn't find ffmpeg source file for platform '{}'"
-        ).format(platform.system()))
+    Args:
+        dirpath (str): Directory where tool is distributed.
+
+    Returns:
+        bool: All files from manifest exist and have expected size.
+
+    """
+    manifest_path = os.path.join(dirpath, DISTRIBUTION_MANIFEST_FILENAME)
+    try:
+        manifest = _read_json(manifest_path)
+    except FileNotFoundError:
+        return True
+    except (OSError, ValueError):
+        return False
 
-    _download_file(file_info, dirpath, progress=progress)
+    # Sizes of symlinks are stored for link itself, not for its target
+    for rel_path, size in manifest.items():
+        try:
+            if os.lstat(os.path.join(dirpath, rel_path)).st_size != size:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _is_distributed(
+    tool_info: List["ToolInfo"],
+    file_info: "ToolDownloadInfo",
+    dirpath: str,
+) -> bool:
+    """Check if file was already distributed to the directory.
+
+    Args:
+        tool_info (List[ToolInfo]): Information about downloaded tool.
+        file_info (ToolDownloadInfo): Information about file on server.
+        dirpath (str): Directory where tool is distributed.
 
-    ffmpeg_info = get_downloaded_ffmpeg_info()
+    Returns:
+        bool: File with the same checksum is already in the directory.
+
+    """
+    return any(
+        item["root"] == dirpath
+        and item["checksum"] == file_info["checksum"]
+        and os.path.exists(dirpath)
+        and _validate_distribution_manifest(dirpath)
+        for item in tool_info
+    )
+
+
+def _store_distributed_info(
+    tool_info: List["ToolInfo"],
+    file_info: "ToolDownloadInfo",
+    dirpath: str,
+    name: str,
+):
     existing_item = next(
         (
             item
-            for item in ffmpeg_info
+            for item in tool_info
             if item["root"] == dirpath
         ),
         None
     )
     if existing_item is None:
         existing_item = {}
-        ffmpeg_info.append(existing_item)
+        tool_info.append(existing_item)
     existing_item.update({
         "root": dirpath,
         "checksum": file_info["checksum"],
         "checksum_algorithm": file_info["checksum_algorithm"],
-        "downloaded": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "downloaded": time.strftime("%Y-%m-%d %H:%M:%S")
     })
-    store_downloaded_ffmpeg_info(ffmpeg_info)
+    store_file_info(name, tool_info)
+
+
+def download_ffmpeg(progress: Optional[TransferProgress] = None):
+    """Download ffmpeg from server.
+
+    Download is guarded by a lock, when other process is downloading
+        the same file, this function waits for it and skips the download.
+
+    Args:
+        progress (ayon_api.TransferProgress): Keep track about download.
+
+    """
+    dirpath = os.path.join(get_download_dir(), "ffmpeg")
+
+    files_info = _get_server_files_info()
+    file_info = _find_file_info("ffmpeg", files_info)
+    if file_info is None:
+        raise ValueError((
+            "Couldn't find ffmpeg source file for platform '{}'"
+        ).format(PLATFORM_NAME))
+
+    with _distribution_lock(dirpath):
+        ffmpeg_info = get_downloaded_ffmpeg_info()
+        if not _is_distributed(ffmpeg_info, file_info, dirpath):
+            _download_file(file_info, dirpath, progress=progress)
+            _store_distributed_info(
+                ffmpeg_info, file_info, dirpath, "ffmpeg"
+            )
 
     _FFmpegArgs.download_needed = False
     _FFmpegArgs.downloaded_root = NOT_SET
+    _invalidate_server_files_info()
 
 
 def download_oiio(progress: Optional[TransferProgress] = None):
     dirpath = os.path.join(get_download_dir(), "oiio")
 
-    files_info = get_server_files_info()
+    files_info = _get_server_files_info()
     file_info = _find_file_info("oiio", files_info)
     if file_info is None:
         raise ValueError((
             "Couldn't find OpenImageIO source file for platform '{}'"
-        ).format(platform.system()))
-
-    _download_file(file_info, dirpath, progress=progress)
-
-    oiio_info = get_downloaded_oiio_info()
-    existing_item = next(
-        (
-            item
-            for item in oiio_info
-            if item["root"] == dirpath
-        ),
-        None
-    )
+        ).format(PLATFORM_NAME))
 
-    if existing_item is None:
-        existing_item = {}
-        oiio_info.append(existing_item)
-    existing_item.update({
-        "root": dirpath,
-        "checksum": file_info["checksum"],
-        "checksum_algorithm": file_info["checksum_algorithm"],
-        "downloaded": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    })
-    store_downloaded_oiio_info(oiio_info)
+    with _distribution_lock(dirpath):
+        oiio_info = get_downloaded_oiio_info()
+        if not _is_distributed(oiio_info, file_info, dirpath):
+            _download_file(file_info, dirpath, progress=progress)
+            _store_distributed_info(oiio_info, file_info, dirpath, "oiio")
 
     _OIIOArgs.download_needed = False
     _OIIOArgs.downloaded_root = NOT_SET
+    _invalidate_server_files_info()
+
+
+def _get_tool_args_fingerprint(family: str) -> str:
+    """Fingerprint of data which affect resolved tool arguments.
+
+    Args:
+        family (str): Tool family, 'ffmpeg' or 'oiio'.
+
+    Only data available locally are used, so fingerprint does not require
+        a server request when addon settings are stored on disk.
+
+    Returns:
+        str: Fingerprint of tool family settings and downloaded files.
+
+    """
+    family_settings = _get_addon_settings()[family]
+    data = {
+        "platform": PLATFORM_NAME,
+        "settings": family_settings,
+    }
+    if family_settings["use_downloaded"]:
+        data["checksums"] = [
+            info.get("checksum")
+            for info in filter_file_info(family)
+            if isinstance(info, dict)
+        ]
+    content = json.dumps(data, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(content, digest_size=8).hexdigest()
+
+
+def _get_persisted_tool_args() -> Dict[str, Any]:
+    if _ThirdPartyCache.persisted_tool_args is NOT_SET:
+        persisted = filter_file_info("tool_args_cache")
+        if not isinstance(persisted, dict):
+            persisted = {}
+        _ThirdPartyCache.persisted_tool_args = persisted
+    return _ThirdPartyCache.persisted_tool_args
+
+
+def _resolve_tool_args(
+    family: str,
+    tool_name: str,
+    args_cache: type,
+    fill_func: Callable[[str], Optional[List[str]]],
+    is_download_needed_func: Callable[[], bool],
+) -> Optional[List[str]]:
+    """Resolve tool arguments, reuse arguments resolved by other process.
+
+    Resolved arguments are persisted with fingerprint of settings and of
+        downloaded files, and with modification time and size of the
+        executable. Persisted arguments are used if fingerprint did not
+        change and the executable was not changed.
+
+    Arguments stored in last 'ADDON_SETTINGS_TTL' seconds are used without
+        any server request. Older arguments are used only if download is
+        not needed, which is checked against files on server.
+
+    Args:
+        family (str): Tool family, 'ffmpeg' or 'oiio'.
+        tool_name (str): Name of tool.
+        args_cache (type): Class caching arguments of the tool family.
+        fill_func (Callable[[str], Optional[List[str]]]): Function
+            resolving arguments.
+        is_download_needed_func (Callable[[], bool]): Function checking
+            if download of the tool family is needed.
+
+    Returns:
+        Optional[List[str]]: Tool arguments.
+
+    """
+    # Keep parallel requests of cold start if settings are not on disk
+    if (
+        _ThirdPartyCache.addon_settings is NOT_SET
+        and _load_persisted_addon_settings() is None
+    ):
+        _prime_caches()
+    fingerprint = _get_tool_args_fingerprint(family)
+    key = f"{family}/{tool_name}"
+    persisted = _get_persisted_tool_args()
+    item = persisted.get(key)
+    is_valid = (
+        isinstance(item, dict)
+        and item.get("fingerprint") == fingerprint
+        and item.get("stat") is not None
+        and (
+            _get_file_stat_key(item["args"][0]) == tuple(item["stat"])
+        )
+    )
+    if is_valid:
+        age = time.time() - item.get("time", 0)
+        if 0 <= age < ADDON_SETTINGS_TTL:
+            args = item["args"]
+            args_cache.tools[tool_name] = args
+            return args
+
+    _prime_caches()
+    if is_valid and not is_download_needed_func():
+        args = item["args"]
+    else:
+        args = fill_func(tool_name)
+
+    stat_key = _get_file_stat_key(args[0]) if args else None
+    if stat_key is not None:
+        args_cache.tools[tool_name] = args
+        persisted[key] = {
+            "fingerprint": fingerprint,
+            "args": args,
+            "stat": list(stat_key),
+            "time": time.time(),
+        }
+        try:
+            store_file_info("tool_args_cache", persisted)
+        except OSError:
+            print("Failed to store resolved tool arguments")
+    return args
 
 
 def get_ffmpeg_arguments(
@@ -757,8 +2612,17 @@ def get_ffmpeg_arguments(
     """
     args = _FFmpegArgs.tools.get(tool_name, NOT_SET)
     if args is NOT_SET:
-        args = _fill_ffmpeg_tool_args(tool_name)
-    return copy.deepcopy(args)
+        args = _resolve_tool_args(
+            "ffmpeg",
+            tool_name,
+            _FFmpegArgs,
+            _fill_ffmpeg_tool_args,
+            is_ffmpeg_download_needed,
+        )
+    # Arguments are flat list of strings, shallow copy is enough
+    if args is not None:
+        args = list(args)
+    return args
 
 
 def get_oiio_arguments(
@@ -778,5 +2642,13 @@ def get_oiio_arguments(
     """
     args = _OIIOArgs.tools.get(tool_name, NOT_SET)
     if args is NOT_SET:
-        args = _fill_oiio_tool_args(tool_name)
-    return copy.deepcopy(args)
+        args = _resolve_tool_args(
+            "oiio",
+            tool_name,
+            _OIIOArgs,
+            _fill_oiio_tool_args,
+            is_oiio_download_needed,
+        )
+    if args is not None:
+        args = list(args)
+    return args
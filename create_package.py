@@ -35,7 +35,10 @@ import zipfile
 import subprocess
 import hashlib
 import urllib.request
-from typing import Optional, Iterable, Pattern, Union, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Optional, Iterable, Iterator, Pattern, Union, List, Tuple, Dict
+)
 
 import package
 
@@ -99,27 +102,32 @@ VERSION_PY_CONTENT = f'''# -*- coding: utf-8 -*-
 __version__ = "{ADDON_VERSION}"
 '''
 
+# Extensions of files stored to package zip without compression
+COMPRESSED_EXTENSIONS: Tuple[str, ...] = (
+    ".zip", ".tgz", ".gz", ".xz", ".bz2", ".zst", ".tzst"
+)
+
 # Patterns of directories to be skipped for server part of addon
 IGNORE_DIR_PATTERNS: List[Pattern] = [
     re.compile(pattern)
-    for pattern in {
+    for pattern in (
         # Skip directories starting with '.'
         r"^\.",
         # Skip any pycache folders
-        "^__pycache__$"
-    }
+        "^__pycache__$",
+    )
 ]
 
 # Patterns of files to be skipped for server part of addon
 IGNORE_FILE_PATTERNS: List[Pattern] = [
     re.compile(pattern)
-    for pattern in {
+    for pattern in (
         # Skip files starting with '.'
         # NOTE this could be an issue in some cases
         r"^\.",
         # Skip '.pyc' files
-        r"\.pyc$"
-    }
+        r"\.pyc$",
+    )
 ]
 
 
@@ -144,92 +152,189 @@ class ZipFileLongPaths(zipfile.ZipFile):
         return super()._extract_member(member, tpath, pwd)
 
 
-def calculate_file_checksum(filepath, hash_algorithm, chunk_size=10000):
-    func = getattr(hashlib, hash_algorithm)
-    hash_obj = func()
+def calculate_file_checksum(filepath, hash_algorithm, chunk_size=1048576):
     with open(filepath, "rb") as f:
+        # Python 3.11+ reads and hashes the file in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, hash_algorithm).hexdigest()
+
+        hash_obj = hashlib.new(hash_algorithm)
         for chunk in iter(lambda: f.read(chunk_size), b""):
             hash_obj.update(chunk)
     return hash_obj.hexdigest()
 
 
-def download_ffmpeg_zip(downloads_dir: str, log: logging.Logger):
-    zip_files_info = []
-    for platform_name, platform_info in FFMPEG_SOURCES.items():
-        src_url: str = platform_info["url"]
-        filename: str = src_url.split("/")[-1]
-        zip_path: str = os.path.join(downloads_dir, filename)
-        checksum: str = platform_info["checksum"]
-        checksum_algorithm: str = platform_info["checksum_algorithm"]
-        zip_files_info.append({
-            "name": "ffmpeg",
-            "filename": filename,
-            "checksum": checksum,
-            "checksum_algorithm": checksum_algorithm,
-            "platform": platform_name,
-        })
-        if os.path.exists(zip_path):
-            file_checksum: str = calculate_file_checksum(
-                zip_path, checksum_algorithm)
-            if checksum == file_checksum:
-                log.debug(f"FFmpeg zip from {src_url} already exists")
-                continue
-            os.remove(zip_path)
+def download_file_with_checksum(
+    src_url: str,
+    filepath: str,
+    hash_algorithm: str,
+    chunk_size: int = 1048576,
+) -> str:
+    """Download file and calculate its checksum at the same time.
+
+    Args:
+        src_url (str): Url of file to download.
+        filepath (str): Path where file will be stored.
+        hash_algorithm (str): Algorithm used to calculate checksum.
+        chunk_size (int): Size of chunks read from response.
 
-        log.debug(f"FFmpeg zip from {src_url} -> {zip_path}")
+    Returns:
+        str: Checksum of downloaded file.
+
+    """
+    hash_obj = hashlib.new(hash_algorithm)
+    with urllib.request.urlopen(src_url) as response:
+        with open(filepath, "wb") as stream:
+            for chunk in iter(lambda: response.read(chunk_size), b""):
+                hash_obj.update(chunk)
+                stream.write(chunk)
+    return hash_obj.hexdigest()
+
+
+def _get_cached_checksum(
+    zip_path: str, checksum_algorithm: str
+) -> Optional[str]:
+    """Checksum stored by previous run if file did not change since.
+
+    Args:
+        zip_path (str): Path to downloaded archive.
+        checksum_algorithm (str): Algorithm of checksum.
+
+    Returns:
+        Optional[str]: Stored checksum or None.
+
+    """
+    try:
+        stat = os.stat(zip_path)
+        with open(f"{zip_path}.checksum", "r") as stream:
+            data = json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        data.get("checksum_algorithm") == checksum_algorithm
+        and data.get("size") == stat.st_size
+        and data.get("mtime_ns") == stat.st_mtime_ns
+    ):
+        return data.get("checksum")
+    return None
+
+
+def _store_cached_checksum(
+    zip_path: str, checksum: str, checksum_algorithm: str
+):
+    stat = os.stat(zip_path)
+    with open(f"{zip_path}.checksum", "w") as stream:
+        json.dump(
+            {
+                "checksum": checksum,
+                "checksum_algorithm": checksum_algorithm,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            },
+            stream
+        )
 
-        log.info("FFmpeg zip download - started")
-        urllib.request.urlretrieve(src_url, zip_path)
-        log.info("FFmpeg zip download - finished")
 
-        file_checksum = calculate_file_checksum(
+def _download_source_file(
+    title: str,
+    src_url: str,
+    zip_path: str,
+    checksum: str,
+    checksum_algorithm: str,
+    log: logging.Logger,
+):
+    if os.path.exists(zip_path):
+        # Avoid hashing of unchanged archive on each package creation
+        file_checksum: Optional[str] = _get_cached_checksum(
             zip_path, checksum_algorithm)
+        if file_checksum is None:
+            file_checksum = calculate_file_checksum(
+                zip_path, checksum_algorithm)
+            _store_cached_checksum(
+                zip_path, file_checksum, checksum_algorithm)
+        if checksum == file_checksum:
+            log.debug(f"{title} zip from {src_url} already exists")
+            return
+        os.remove(zip_path)
+
+    log.debug(f"{title} zip from {src_url} -> {zip_path}")
+
+    filename: str = os.path.basename(zip_path)
+    log.info(f"{title} zip download - started ({filename})")
+    file_checksum = download_file_with_checksum(
+        src_url, zip_path, checksum_algorithm)
+    log.info(f"{title} zip download - finished ({filename})")
+
+    if checksum != file_checksum:
+        raise Exception(
+            f"{title} zip checksum mismatch: {file_checksum} != {checksum}"
+        )
+    _store_cached_checksum(zip_path, file_checksum, checksum_algorithm)
 
-        if checksum != file_checksum:
-            raise Exception(
-                f"FFmpeg zip checksum mismatch: {file_checksum} != {checksum}"
-            )
 
-    return zip_files_info
+def _download_source_files(
+    name: str,
+    title: str,
+    sources: Dict[str, Dict[str, str]],
+    downloads_dir: str,
+    log: logging.Logger,
+) -> List[Dict[str, str]]:
+    """Download source archives of all platforms in parallel.
+
+    Args:
+        name (str): Name of tool used in files info.
+        title (str): Title of tool used in log messages.
+        sources (dict[str, dict[str, str]]): Source archive information
+            by platform name.
+        downloads_dir (str): Directory where archives are downloaded.
+        log (logging.Logger): Logger object.
 
+    Returns:
+        list[dict[str, str]]: Information about downloaded archives.
 
-def download_oiio_zip(downloads_dir: str, log: logging.Logger):
+    """
     zip_files_info = []
-    for platform_name, platform_info in OIIO_SOURCES.items():
+    jobs = []
+    for platform_name, platform_info in sources.items():
         src_url: str = platform_info["url"]
         filename: str = src_url.split("/")[-1]
         zip_path: str = os.path.join(downloads_dir, filename)
         checksum: str = platform_info["checksum"]
         checksum_algorithm: str = platform_info["checksum_algorithm"]
         zip_files_info.append({
-            "name": "oiio",
+            "name": name,
             "filename": filename,
             "checksum": checksum,
             "checksum_algorithm": checksum_algorithm,
-            "platform": platform_name
+            "platform": platform_name,
         })
-        if os.path.exists(zip_path):
-            file_checksum = calculate_file_checksum(
-                zip_path, checksum_algorithm)
-            if checksum == file_checksum:
-                log.debug(f"OIIO zip from {src_url} already exists")
-                continue
-            os.remove(zip_path)
-        log.debug(f"OIIO zip from {src_url} -> {zip_path}")
-
-        log.info("OIIO zip download - started")
-        urllib.request.urlretrieve(src_url, zip_path)
-        log.info("OIIO zip download - finished")
-
-        file_checksum = calculate_file_checksum(zip_path, checksum_algorithm)
-        if file_checksum != checksum:
-            raise Exception(
-                f"OIIO zip checksum mismatch: {file_checksum} != {checksum}"
-            )
+        jobs.append((src_url, zip_path, checksum, checksum_algorithm))
+
+    # Downloads are network bound and independent of each other
+    with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+        futures = [
+            executor.submit(_download_source_file, title, *job, log)
+            for job in jobs
+        ]
+        for future in futures:
+            future.result()
 
     return zip_files_info
 
 
+def download_ffmpeg_zip(downloads_dir: str, log: logging.Logger):
+    return _download_source_files(
+        "ffmpeg", "FFmpeg", FFMPEG_SOURCES, downloads_dir, log
+    )
+
+
+def download_oiio_zip(downloads_dir: str, log: logging.Logger):
+    return _download_source_files(
+        "oiio", "OIIO", OIIO_SOURCES, downloads_dir, log
+    )
+
+
 def _get_yarn_executable() -> Union[str, None]:
     cmd = "which"
     if platform.system().lower() == "windows":
@@ -262,9 +367,12 @@ def safe_copy_file(src_path: str, dst_path: str):
         return
 
     dst_dir: str = os.path.dirname(dst_path)
-    os.makedirs(dst_dir, exist_ok=True)
+    # 'os.makedirs' raises and catches an error for existing directory
+    if not os.path.isdir(dst_dir):
+        os.makedirs(dst_dir, exist_ok=True)
 
-    shutil.copy2(src_path, dst_path)
+    # Metadata of copied files are not needed in package, copy only content
+    shutil.copyfile(src_path, dst_path)
 
 
 def _value_match_regexes(value: str, regexes: Iterable[Pattern]) -> bool:
@@ -274,11 +382,29 @@ def _value_match_regexes(value: str, regexes: Iterable[Pattern]) -> bool:
     )
 
 
+def _combine_regexes(regexes: Iterable[Pattern]) -> List[Pattern]:
+    """Combine regexes with the same flags to a single alternation.
+
+    Args:
+        regexes (Iterable[Pattern]): Regexes to combine.
+
+    Returns:
+        list[Pattern]: Combined regexes, one per used flags.
+    """
+    patterns_by_flags = {}
+    for regex in regexes:
+        patterns_by_flags.setdefault(regex.flags, []).append(regex.pattern)
+    return [
+        re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+        for flags, patterns in patterns_by_flags.items()
+    ]
+
+
 def find_files_in_subdir(
     src_path: str,
     ignore_file_patterns: Optional[List[Pattern]] = None,
     ignore_dir_patterns: Optional[List[Pattern]] = None
-) -> List[Tuple[str, str]]:
+) -> Iterator[Tuple[str, str]]:
     """Find all files to copy in subdirectories of given path.
 
     All files that match any of the patterns in 'ignore_file_patterns' will
@@ -292,9 +418,9 @@ def find_files_in_subdir(
         ignore_dir_patterns (Optional[list[Pattern]]): List of regexes
             to match directories to ignore.
 
-    Returns:
-        list[tuple[str, str]]: List of tuples with path to file and parent
-            directories relative to 'src_path'.
+    Yields:
+        tuple[str, str]: Path to file and path relative to 'src_path'.
+            Files are yielded while directories are walked.
     """
 
     if ignore_file_patterns is None:
@@ -302,30 +428,33 @@ def find_files_in_subdir(
 
     if ignore_dir_patterns is None:
         ignore_dir_patterns = IGNORE_DIR_PATTERNS
-    output: List[Tuple[str, str]] = []
+
+    # Search each name with one regex instead of one regex per pattern
+    ignore_file_patterns = _combine_regexes(ignore_file_patterns)
+    ignore_dir_patterns = _combine_regexes(ignore_dir_patterns)
     if not os.path.exists(src_path):
-        return output
+        return
 
+    # Relative path of directory is kept as prefix string, so relative
+    #   path of file is created with single concatenation
     hierarchy_queue: collections.deque = collections.deque()
-    hierarchy_queue.append((src_path, []))
+    hierarchy_queue.append((src_path, ""))
     while hierarchy_queue:
         item: Tuple[str, str] = hierarchy_queue.popleft()
-        dirpath, parents = item
-        for name in os.listdir(dirpath):
-            path: str = os.path.join(dirpath, name)
-            if os.path.isfile(path):
-                if not _value_match_regexes(name, ignore_file_patterns):
-                    items: List[str] = list(parents)
-                    items.append(name)
-                    output.append((path, os.path.sep.join(items)))
-                continue
-
-            if not _value_match_regexes(name, ignore_dir_patterns):
-                items: List[str] = list(parents)
-                items.append(name)
-                hierarchy_queue.append((path, items))
-
-    return output
+        dirpath, prefix = item
+        # 'os.scandir' entries know their type without additional stat
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                name: str = entry.name
+                if entry.is_file():
+                    if not _value_match_regexes(name, ignore_file_patterns):
+                        yield entry.path, prefix + name
+                    continue
+
+                if not _value_match_regexes(name, ignore_dir_patterns):
+                    hierarchy_queue.append(
+                        (entry.path, prefix + name + os.path.sep)
+                    )
 
 
 def update_client_version(logger):
@@ -453,6 +582,14 @@ def copy_client_code(output_dir: str, log: logging.Logger):
     log.info("Client copy finished")
 
 
+def _copy_package_file(src_file: Union[str, io.BytesIO], dst_path: str):
+    if isinstance(src_file, io.BytesIO):
+        with open(dst_path, "wb") as stream:
+            stream.write(src_file.getvalue())
+    else:
+        safe_copy_file(src_file, dst_path)
+
+
 def copy_addon_package(
     output_dir: str,
     files_mapping: List[FileMapping],
@@ -479,16 +616,27 @@ def copy_addon_package(
 
     os.makedirs(addon_output_dir, exist_ok=True)
 
-    # Copy server content
-    for src_file, dst_subpath in files_mapping:
-        dst_path: str = os.path.join(addon_output_dir, dst_subpath)
-        dst_dir: str = os.path.dirname(dst_path)
+    copy_items: List[FileMapping] = [
+        (src_file, os.path.join(addon_output_dir, dst_subpath))
+        for src_file, dst_subpath in files_mapping
+    ]
+    # Create directories before copying so threads don't race on them
+    for dst_dir in sorted({
+        os.path.dirname(dst_path)
+        for _, dst_path in copy_items
+    }):
         os.makedirs(dst_dir, exist_ok=True)
-        if isinstance(src_file, io.BytesIO):
-            with open(dst_path, "wb") as stream:
-                stream.write(src_file.getvalue())
-        else:
-            safe_copy_file(src_file, dst_path)
+
+    # Copy server content, copies are independent so are done in threads
+    with ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 4)
+    ) as executor:
+        futures = [
+            executor.submit(_copy_package_file, src_file, dst_path)
+            for src_file, dst_path in copy_items
+        ]
+        for future in futures:
+            future.result()
 
     log.info("Package copy finished")
 
@@ -508,10 +656,21 @@ def create_addon_package(
     with ZipFileLongPaths(output_path, "w", zipfile.ZIP_DEFLATED) as zipf:
         # Copy server content
         for src_file, dst_subpath in files_mapping:
+            # Compressing already compressed archives only burns CPU
+            compress_type = None
+            if dst_subpath.lower().endswith(COMPRESSED_EXTENSIONS):
+                compress_type = zipfile.ZIP_STORED
+
             if isinstance(src_file, io.BytesIO):
-                zipf.writestr(dst_subpath, src_file.getvalue())
+                zipf.writestr(
+                    dst_subpath,
+                    src_file.getvalue(),
+                    compress_type=compress_type
+                )
             else:
-                zipf.write(src_file, dst_subpath)
+                zipf.write(
+                    src_file, dst_subpath, compress_type=compress_type
+                )
 
     log.info("Package created")
 
@@ -527,9 +686,12 @@ def main(
     downloads_dir = os.path.join(CURRENT_ROOT, "downloads")
     os.makedirs(downloads_dir, exist_ok=True)
 
-    ffmpeg_files_info = download_ffmpeg_zip(downloads_dir, log)
-    oiio_files_info = download_oiio_zip(downloads_dir, log)
-    files_info = ffmpeg_files_info + oiio_files_info
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ffmpeg_future = executor.submit(
+            download_ffmpeg_zip, downloads_dir, log
+        )
+        oiio_future = executor.submit(download_oiio_zip, downloads_dir, log)
+        files_info = ffmpeg_future.result() + oiio_future.result()
 
     files_info_stream = io.BytesIO(json.dumps(files_info).encode())
 
@@ -14,6 +14,7 @@ CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class ThirdPartyDistAddon(BaseServerAddon):
     settings_model = ThirdPartySettings
+    _files_info_cache = None
 
     def initialize(self):
         self.add_endpoint(
@@ -31,6 +32,11 @@ class ThirdPartyDistAddon(BaseServerAddon):
         info_filepath = os.path.join(
             os.path.dirname(CURRENT_DIR), "private", "files_info.json"
         )
-        with open(info_filepath, "r") as stream:
-            data = json.load(stream)
-        return data
+        # File is created with package, parse it again only if it changed
+        mtime = os.stat(info_filepath).st_mtime_ns
+        cache = self._files_info_cache
+        if cache is None or cache[0] != mtime:
+            with open(info_filepath, "r") as stream:
+                cache = (mtime, json.load(stream))
+            self._files_info_cache = cache
+        return cache[1]
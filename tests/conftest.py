@@ -0,0 +1,52 @@
+import os
+import sys
+import types
+
+import pytest
+
+CLIENT_ROOT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "client"
+)
+
+
+def _stub_ayon_core():
+    """Register minimal 'ayon_core' so client code can be imported.
+
+    Client code runs inside AYON launcher which provides 'ayon_core', tests
+    replace only the functions used by 'ayon_third_party'.
+    """
+    if "ayon_core" in sys.modules:
+        return
+    ayon_core = types.ModuleType("ayon_core")
+    lib = types.ModuleType("ayon_core.lib")
+    lib.get_launcher_storage_dir = lambda *args: os.path.join(
+        os.getcwd(), *args
+    )
+    addon = types.ModuleType("ayon_core.addon")
+    addon.AYONAddon = type("AYONAddon", (), {})
+    addon.ITrayAddon = type("ITrayAddon", (), {})
+    ayon_core.lib = lib
+    ayon_core.addon = addon
+    sys.modules["ayon_core"] = ayon_core
+    sys.modules["ayon_core.lib"] = lib
+    sys.modules["ayon_core.addon"] = addon
+
+
+_stub_ayon_core()
+sys.path.insert(0, CLIENT_ROOT)
+
+
+@pytest.fixture
+def utils(tmp_path, monkeypatch):
+    """Client utils with storage and caches isolated to the test."""
+    from ayon_third_party import utils
+
+    monkeypatch.setattr(
+        utils,
+        "get_launcher_storage_dir",
+        lambda *args: os.path.join(tmp_path, "storage", *args),
+    )
+    utils._get_info_path.cache_clear()
+    monkeypatch.setattr(utils._ThirdPartyCache, "file_info", {})
+    yield utils
+    utils._get_info_path.cache_clear()
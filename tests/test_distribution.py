@@ -0,0 +1,123 @@
+import io
+import os
+import tarfile
+
+import pytest
+
+
+def _add_file(tar, name, data):
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def _add_symlink(tar, name, target):
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.SYMTYPE
+    info.linkname = target
+    tar.addfile(info)
+
+
+def test_manifest_valid_with_symlinks(utils, tmp_path):
+    archive_path = os.path.join(tmp_path, "ffmpeg.tar.gz")
+    with tarfile.open(archive_path, "w:gz") as tar:
+        _add_file(tar, "lib/libavcodec.so.60", b"x" * 1000)
+        _add_symlink(tar, "lib/libavcodec.so", "libavcodec.so.60")
+
+    dirpath = os.path.join(tmp_path, "ffmpeg")
+    utils.extract_archive_file(archive_path, dirpath)
+    utils._store_distribution_manifest(dirpath)
+
+    assert os.path.islink(os.path.join(dirpath, "lib", "libavcodec.so"))
+    assert utils._validate_distribution_manifest(dirpath)
+
+
+def test_manifest_invalid_after_file_change(utils, tmp_path):
+    dirpath = os.path.join(tmp_path, "ffmpeg")
+    os.makedirs(dirpath)
+    filepath = os.path.join(dirpath, "ffmpeg")
+    with open(filepath, "wb") as stream:
+        stream.write(b"x" * 10)
+    utils._store_distribution_manifest(dirpath)
+
+    with open(filepath, "wb") as stream:
+        stream.write(b"x")
+    assert not utils._validate_distribution_manifest(dirpath)
+
+
+def test_move_tree_keeps_directory_symlinks(utils, tmp_path):
+    src_dir = os.path.join(tmp_path, "staging")
+    dst_dir = os.path.join(tmp_path, "ffmpeg")
+    versions_dir = os.path.join(src_dir, "Framework", "Versions")
+    os.makedirs(os.path.join(versions_dir, "A"))
+    with open(os.path.join(versions_dir, "A", "lib"), "wb") as stream:
+        stream.write(b"x")
+    os.symlink("A", os.path.join(versions_dir, "Current"))
+
+    utils._move_tree(src_dir, dst_dir)
+
+    current = os.path.join(dst_dir, "Framework", "Versions", "Current")
+    assert os.path.islink(current)
+    assert os.readlink(current) == "A"
+    assert os.path.isfile(os.path.join(current, "lib"))
+
+
+def _add_hardlink(tar, name, target):
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.LNKTYPE
+    info.linkname = target
+    tar.addfile(info)
+
+
+@pytest.mark.parametrize("use_data_filter", [True, False])
+@pytest.mark.parametrize(
+    "member_type", ["dotdot", "absolute", "symlink", "hardlink"]
+)
+def test_extract_tar_stream_refuses_unsafe_members(
+    utils, tmp_path, monkeypatch, use_data_filter, member_type
+):
+    if not use_data_filter:
+        monkeypatch.setattr(utils, "_TAR_DATA_FILTER", None)
+    elif utils._TAR_DATA_FILTER is None:
+        pytest.skip("tarfile.data_filter is not available")
+
+    outside_path = os.path.join(tmp_path, "outside.txt")
+    content = io.BytesIO()
+    with tarfile.open(fileobj=content, mode="w:gz") as tar:
+        _add_file(tar, "bin/ffmpeg", b"ffmpeg")
+        if member_type == "dotdot":
+            _add_file(tar, "../../outside.txt", b"x")
+        elif member_type == "absolute":
+            _add_file(tar, outside_path, b"x")
+        elif member_type == "symlink":
+            _add_symlink(tar, "lib/escape", "../../..")
+        else:
+            _add_hardlink(tar, "lib/passwd", "../../etc/passwd")
+    content.seek(0)
+
+    staging_dir = os.path.join(tmp_path, "root", "staging")
+    # Data filter extracts absolute paths relative to destination
+    if member_type == "absolute" and use_data_filter:
+        utils.extract_tar_stream(content, ".tar.gz", staging_dir)
+    else:
+        with pytest.raises(ValueError):
+            utils.extract_tar_stream(content, ".tar.gz", staging_dir)
+
+    assert not os.path.exists(outside_path)
+    assert not os.path.lexists(os.path.join(staging_dir, "lib", "escape"))
+    assert not os.path.exists(os.path.join(staging_dir, "lib", "passwd"))
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("ffmpeg.ZIP", (".zip", "zip")),
+        ("ffmpeg.tar.gz", (".tar.gz", "tar")),
+        ("ffmpeg.tgz", (".tgz", "tar")),
+        ("ffmpeg.tar", (".tar", "tar")),
+        ("ffmpeg.tar.zst", (".tar.zst", "tar")),
+        ("ffmpeg.gz", (None, None)),
+    ],
+)
+def test_get_archive_ext_and_type(utils, filename, expected):
+    assert utils.get_archive_ext_and_type(filename) == expected
@@ -0,0 +1,229 @@
+import hashlib
+import http.server
+import os
+import re
+import threading
+import time
+
+import pytest
+import requests
+
+CONTENT = os.urandom(3 * 1024 * 1024 + 17)
+# Content downloaded with mocked session
+SESSION_CONTENT = os.urandom(1024 * 1024 + 17)
+SESSION_CHUNK_SIZE = 64 * 1024
+SESSION_URL = "http://server/file.zip"
+
+
+class _NoHeadHandler(http.server.BaseHTTPRequestHandler):
+    """Server which does not allow HEAD, like FastAPI GET endpoints."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(405)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(CONTENT)))
+        self.end_headers()
+        self.wfile.write(CONTENT)
+
+
+@pytest.fixture
+def server_url():
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), _NoHeadHandler
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/file.zip"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_download_without_head_support(utils, tmp_path, server_url):
+    filepath = os.path.join(tmp_path, "file.zip")
+
+    checksum = utils.download_ranged(
+        server_url, filepath, checksum_algorithm="sha256"
+    )
+
+    assert checksum == hashlib.sha256(CONTENT).hexdigest()
+    with open(filepath, "rb") as stream:
+        assert stream.read() == CONTENT
+    assert not os.path.exists(f"{filepath}.part.meta")
+
+
+def test_download_state_throttles_meta_writes(utils, tmp_path, monkeypatch):
+    meta_path = os.path.join(tmp_path, "file.zip.part.meta")
+    stored = []
+    monkeypatch.setattr(
+        utils,
+        "_store_download_meta",
+        lambda path, meta: stored.append(meta["segments"][0][1])
+    )
+    segment = [0, 0, None]
+    state = utils._DownloadState(
+        meta_path, {"segments": [segment]}, utils.TransferProgress()
+    )
+    chunk_size = utils.DOWNLOAD_CHUNK_SIZE
+    chunks_count = utils.DOWNLOAD_META_STORE_SIZE // chunk_size
+    for _ in range(chunks_count + 1):
+        state.commit(segment, chunk_size)
+    state.set_done()
+
+    assert stored == [
+        chunks_count * chunk_size,
+        (chunks_count + 1) * chunk_size,
+    ]
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=b"", headers=None, fail=False):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self._fail = fail
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def iter_content(self, chunk_size):
+        if self._fail:
+            raise requests.exceptions.ChunkedEncodingError("broken")
+        for start in range(0, len(self._body), SESSION_CHUNK_SIZE):
+            time.sleep(0.005)
+            yield self._body[start:start + SESSION_CHUNK_SIZE]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class _FakeSession:
+    """Session serving 'SESSION_CONTENT' with optional range support."""
+
+    def __init__(self, ranges=True, fail_start=None):
+        self.ranges = ranges
+        self.fail_start = fail_start
+        self.ranges_requested = []
+
+    def head(self, url, headers=None, allow_redirects=False):
+        return _FakeResponse(200, headers={
+            "Content-Length": str(len(SESSION_CONTENT)),
+            "Accept-Ranges": "bytes",
+            "ETag": '"v1"',
+        })
+
+    def get(self, url, headers=None, stream=False):
+        range_value = (headers or {}).get("Range")
+        self.ranges_requested.append(range_value)
+        if range_value is None or not self.ranges:
+            return _FakeResponse(200, SESSION_CONTENT)
+
+        match = re.match(r"bytes=(\d+)-(\d*)", range_value)
+        start = int(match.group(1))
+        end = len(SESSION_CONTENT) - 1
+        if match.group(2):
+            end = int(match.group(2))
+        return _FakeResponse(
+            206,
+            SESSION_CONTENT[start:end + 1],
+            fail=start == self.fail_start,
+        )
+
+
+@pytest.fixture
+def session(utils, monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(utils, "_get_http_session", lambda: session)
+    monkeypatch.setattr(utils, "RANGED_DOWNLOAD_MIN_SIZE", 1)
+    return session
+
+
+def test_failed_segment_stores_positions_of_other_segments(
+    utils, tmp_path, session
+):
+    filepath = os.path.join(tmp_path, "file.zip")
+    session.fail_start = 0
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        utils.download_ranged(SESSION_URL, filepath, connections=4)
+
+    meta = utils._read_download_meta(f"{filepath}.part.meta")
+    segments = meta["segments"]
+    assert len(segments) == 4
+    assert segments[0][1] == 0
+    for start, position, end in segments[1:]:
+        assert position == end + 1
+
+
+def _read_file(filepath):
+    with open(filepath, "rb") as stream:
+        return stream.read()
+
+
+def test_download_by_ranges(utils, tmp_path, session):
+    filepath = os.path.join(tmp_path, "file.zip")
+
+    checksum = utils.download_ranged(
+        SESSION_URL, filepath, connections=4, checksum_algorithm="sha256"
+    )
+
+    assert checksum == hashlib.sha256(SESSION_CONTENT).hexdigest()
+    assert _read_file(filepath) == SESSION_CONTENT
+    assert len(session.ranges_requested) == 4
+    assert all(
+        value.startswith("bytes=") for value in session.ranges_requested
+    )
+    assert not os.path.exists(f"{filepath}.part.meta")
+
+
+def test_download_resumes_from_part_file(utils, tmp_path, session):
+    filepath = os.path.join(tmp_path, "file.zip")
+    part_path = f"{filepath}.part"
+    size = len(SESSION_CONTENT)
+    half = size // 2
+    with open(part_path, "wb") as stream:
+        stream.write(SESSION_CONTENT[:half])
+        stream.write(b"\0" * (size - half))
+    utils._store_download_meta(f"{part_path}.meta", {
+        "validator": '"v1"',
+        "size": size,
+        "segments": [[0, half, size - 1]],
+    })
+
+    checksum = utils.download_ranged(
+        SESSION_URL, filepath, checksum_algorithm="sha256"
+    )
+
+    assert session.ranges_requested == [f"bytes={half}-{size - 1}"]
+    assert checksum == hashlib.sha256(SESSION_CONTENT).hexdigest()
+    assert _read_file(filepath) == SESSION_CONTENT
+
+
+def test_download_falls_back_when_range_is_ignored(utils, tmp_path, session):
+    filepath = os.path.join(tmp_path, "file.zip")
+    # HEAD advertises ranges but GET always returns whole content
+    session.ranges = False
+
+    checksum = utils.download_ranged(
+        SESSION_URL, filepath, connections=4, checksum_algorithm="sha256"
+    )
+
+    assert checksum == hashlib.sha256(SESSION_CONTENT).hexdigest()
+    assert _read_file(filepath) == SESSION_CONTENT
+    assert session.ranges_requested[-1] is None
@@ -0,0 +1,51 @@
+import hashlib
+
+import pytest
+
+
+def test_filter_file_info_returns_copy(utils):
+    utils.store_file_info("validation", [{"args": ["ffmpeg"]}])
+
+    info = utils.filter_file_info("validation")
+    info[0]["args"].append("-version")
+    info.append({"args": ["oiiotool"]})
+
+    assert utils.filter_file_info("validation") == [{"args": ["ffmpeg"]}]
+
+
+def test_calculate_file_checksum_errors(utils, tmp_path):
+    filepath = tmp_path / "file.bin"
+    filepath.write_bytes(b"content")
+
+    assert utils.calculate_file_checksum(str(filepath), "md5") == (
+        hashlib.md5(b"content").hexdigest()
+    )
+    with pytest.raises(ValueError, match="doesn't exist"):
+        utils.calculate_file_checksum(str(tmp_path / "missing"), "md5")
+    with pytest.raises(ValueError, match="is not a file"):
+        utils.calculate_file_checksum(str(tmp_path), "md5")
+
+
+def test_store_validated_args_merges_other_process_keys(utils, monkeypatch):
+    monkeypatch.setattr(
+        utils._ThirdPartyCache, "validated_args", utils.NOT_SET
+    )
+    assert utils._get_validated_args() == []
+
+    # Other process stored its key after this process read the file
+    utils.store_file_info("validation", ["other"])
+    utils._store_validated_args(["own"])
+
+    assert utils.filter_file_info("validation") == ["other", "own"]
+    assert utils._get_validated_args() == ["other", "own"]
+
+
+def test_validated_args_of_wrong_type_are_ignored(utils, monkeypatch):
+    monkeypatch.setattr(
+        utils._ThirdPartyCache, "validated_args", utils.NOT_SET
+    )
+    utils.store_file_info("validation", {"key": "value"})
+
+    assert utils._get_validated_args() == []
+    utils._store_validated_args(["own"])
+    assert utils.filter_file_info("validation") == ["own"]
@@ -0,0 +1,97 @@
+import time
+
+
+def _settings(use_downloaded=True):
+    return {
+        family: {
+            "use_downloaded": use_downloaded,
+            "custom_args": {},
+            "custom_roots": {},
+        }
+        for family in ("ffmpeg", "oiio")
+    }
+
+
+def test_missing_downloaded_root_returns_none(utils, monkeypatch):
+    monkeypatch.setattr(utils, "is_ffmpeg_download_needed", lambda *a: False)
+    monkeypatch.setattr(utils, "is_oiio_download_needed", lambda *a: False)
+    monkeypatch.setattr(utils, "get_downloaded_ffmpeg_root", lambda: None)
+    monkeypatch.setattr(utils, "get_downloaded_oiio_root", lambda: None)
+    monkeypatch.setattr(utils._FFmpegArgs, "tools", {"ffmpeg": None})
+    monkeypatch.setattr(utils._OIIOArgs, "tools", {"oiiotool": None})
+
+    assert utils._fill_ffmpeg_tool_args("ffmpeg", _settings()) is None
+    assert utils._fill_oiio_tool_args("oiiotool", _settings()) is None
+
+
+def test_persisted_args_invalidated_by_executable_change(
+    utils, tmp_path, monkeypatch
+):
+    executable = tmp_path / "ffmpeg"
+    executable.write_bytes(b"v1")
+    monkeypatch.setattr(utils, "_prime_caches", lambda: None)
+    monkeypatch.setattr(
+        utils, "_get_tool_args_fingerprint", lambda family: "fingerprint"
+    )
+    monkeypatch.setattr(
+        utils._ThirdPartyCache, "persisted_tool_args", utils.NOT_SET
+    )
+    monkeypatch.setattr(utils._FFmpegArgs, "tools", {"ffmpeg": None})
+    calls = []
+
+    def fill_func(tool_name):
+        calls.append(tool_name)
+        return [str(executable)]
+
+    def resolve():
+        return utils._resolve_tool_args(
+            "ffmpeg", "ffmpeg", utils._FFmpegArgs, fill_func, lambda: False
+        )
+
+    assert resolve() == [str(executable)]
+    assert resolve() == [str(executable)]
+    assert len(calls) == 1
+
+    executable.write_bytes(b"version 2")
+    assert resolve() == [str(executable)]
+    assert len(calls) == 2
+
+
+def test_existing_roots_cache_is_invalidated(utils, tmp_path):
+    root = tmp_path / "ffmpeg"
+    utils.invalidate_download_needed_cache()
+    assert utils._get_existing_roots((str(root),)) == ()
+
+    root.mkdir()
+    utils.invalidate_download_needed_cache()
+    assert utils._get_existing_roots((str(root),)) == (str(root),)
+
+
+def test_recent_persisted_args_skip_server(utils, tmp_path, monkeypatch):
+    executable = tmp_path / "ffmpeg"
+    executable.write_bytes(b"v1")
+    stat = executable.stat()
+    monkeypatch.setattr(utils._ThirdPartyCache, "addon_settings", _settings())
+    monkeypatch.setattr(utils._FFmpegArgs, "tools", {"ffmpeg": None})
+    utils.store_file_info("tool_args_cache", {
+        "ffmpeg/ffmpeg": {
+            "fingerprint": utils._get_tool_args_fingerprint("ffmpeg"),
+            "args": [str(executable)],
+            "stat": [stat.st_mtime_ns, stat.st_size],
+            "time": time.time(),
+        }
+    })
+    monkeypatch.setattr(
+        utils._ThirdPartyCache, "persisted_tool_args", utils.NOT_SET
+    )
+
+    def _server_request(*args):
+        raise AssertionError("Server should not be requested")
+
+    monkeypatch.setattr(utils, "_prime_caches", _server_request)
+    monkeypatch.setattr(utils, "_get_server_files_info", _server_request)
+
+    args = utils._resolve_tool_args(
+        "ffmpeg", "ffmpeg", utils._FFmpegArgs, _server_request, _server_request
+    )
+    assert args == [str(executable)]
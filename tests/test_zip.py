@@ -0,0 +1,112 @@
+import os
+import struct
+import zipfile
+
+import pytest
+
+MEMBERS = {
+    "bin/ffmpeg": (b"ffmpeg binary " * 5000, zipfile.ZIP_STORED),
+    "bin/ffprobe": (b"ffprobe binary " * 5000, zipfile.ZIP_DEFLATED),
+    "lib/libavcodec.so": (os.urandom(300 * 1024), zipfile.ZIP_STORED),
+    "LICENSE.txt": (b"license", zipfile.ZIP_DEFLATED),
+}
+
+
+def _write_zip(archive_path, members):
+    with zipfile.ZipFile(archive_path, "w") as zip_file:
+        for name, (data, compress_type) in members.items():
+            info = zipfile.ZipInfo(name)
+            info.compress_type = compress_type
+            # Extra field moves data of member in local file header
+            info.extra = struct.pack("<HH4s", 0xCAFE, 4, b"test")
+            zip_file.writestr(info, data)
+
+
+def _read_file(filepath):
+    with open(filepath, "rb") as stream:
+        return stream.read()
+
+
+@pytest.fixture(params=[True, False], ids=["sendfile", "copy"])
+def zip_utils(utils, request, monkeypatch):
+    use_sendfile = request.param
+    if use_sendfile and not hasattr(os, "sendfile"):
+        pytest.skip("os.sendfile is not available")
+    monkeypatch.setattr(
+        utils.ZipFileLongPaths, "_use_sendfile", use_sendfile
+    )
+    return utils
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_extract_changed_content(zip_utils, tmp_path, monkeypatch, workers):
+    utils = zip_utils
+    monkeypatch.setattr(utils, "ZIP_EXTRACT_WORKERS", workers)
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 4)
+    archive_path = os.path.join(tmp_path, "ffmpeg.zip")
+    _write_zip(archive_path, MEMBERS)
+    dst_folder = os.path.join(tmp_path, "ffmpeg")
+    stored_members = []
+    extract_stored_member = utils.ZipFileLongPaths._extract_stored_member
+
+    def _extract_stored_member(self, member, tpath):
+        stored_members.append(member.filename)
+        return extract_stored_member(self, member, tpath)
+
+    monkeypatch.setattr(
+        utils.ZipFileLongPaths,
+        "_extract_stored_member",
+        _extract_stored_member,
+    )
+    parallel_calls = []
+    extract_parallel = utils.ZipFileLongPaths._extract_parallel
+
+    def _extract_parallel(self, members, *args):
+        parallel_calls.append(len(members))
+        return extract_parallel(self, members, *args)
+
+    monkeypatch.setattr(
+        utils.ZipFileLongPaths, "_extract_parallel", _extract_parallel
+    )
+
+    with utils.ZipFileLongPaths(archive_path) as zip_file:
+        assert zip_file.extract_changed(dst_folder) == len(MEMBERS)
+
+    for name, (data, _) in MEMBERS.items():
+        assert _read_file(os.path.join(dst_folder, name)) == data
+    assert parallel_calls == ([len(MEMBERS)] if workers > 1 else [])
+
+    if utils.ZipFileLongPaths._use_sendfile:
+        assert sorted(stored_members) == ["bin/ffmpeg", "lib/libavcodec.so"]
+    else:
+        assert stored_members == []
+
+
+def test_extract_changed_skips_unchanged(zip_utils, tmp_path):
+    utils = zip_utils
+    archive_path = os.path.join(tmp_path, "ffmpeg.zip")
+    _write_zip(archive_path, MEMBERS)
+    dst_folder = os.path.join(tmp_path, "ffmpeg")
+    with utils.ZipFileLongPaths(archive_path) as zip_file:
+        zip_file.extract_changed(dst_folder)
+
+    # Nothing changed
+    with utils.ZipFileLongPaths(archive_path) as zip_file:
+        assert zip_file.extract_changed(dst_folder) == 0
+
+    # File on disk was truncated
+    with open(os.path.join(dst_folder, "LICENSE.txt"), "wb") as stream:
+        stream.write(b"lic")
+    with utils.ZipFileLongPaths(archive_path) as zip_file:
+        assert zip_file.extract_changed(dst_folder) == 1
+    assert _read_file(os.path.join(dst_folder, "LICENSE.txt")) == b"license"
+
+    # Member changed in archive
+    members = dict(MEMBERS)
+    members["bin/ffmpeg"] = (b"new ffmpeg binary", zipfile.ZIP_STORED)
+    _write_zip(archive_path, members)
+    with utils.ZipFileLongPaths(archive_path) as zip_file:
+        assert zip_file.extract_changed(dst_folder) == 1
+    assert _read_file(os.path.join(dst_folder, "bin", "ffmpeg")) == (
+        b"new ffmpeg binary"
+    )